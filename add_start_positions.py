@@ -4,6 +4,8 @@
 from pathlib import Path
 import numpy as np
 
+from src.map_io import is_map_folder, load_map_data, save_array
+
 
 def add_start_positions():
     """Add start.npy to all maps that don't have it."""
@@ -19,17 +21,20 @@ def add_start_positions():
             continue
 
         # Check if this is a valid map folder
-        target_file = map_folder / "target.npy"
-        obstacles_file = map_folder / "obstacles.npy"
         start_file = map_folder / "start.npy"
 
-        if not (target_file.exists() and obstacles_file.exists()):
+        if not is_map_folder(map_folder):
             continue  # Not a valid map
 
-        # Add start.npy if it doesn't exist
-        if not start_file.exists():
+        data = load_map_data(map_folder)
+        if data is None:
+            print(f"  '{map_folder.name}' has no target or obstacles, skipped")
+            continue
+
+        # Add start.npy if the map has no start (it may be inside map.npz)
+        if data.start is None:
             default_start = np.array([[350, 200]])
-            np.save(start_file, default_start)
+            save_array(start_file, default_start)
             print(f"✓ Added start position to '{map_folder.name}' (default: 350, 200)")
             updated.append(map_folder.name)
         else:
@@ -4,6 +4,8 @@
 from pathlib import Path
 import sys
 
+from src.map_io import is_map_folder
+
 
 def list_maps():
     """List all maps in the maps directory."""
@@ -17,16 +19,8 @@ def list_maps():
     # Find all map folders
     maps = {}
     for map_folder in maps_dir.iterdir():
-        if map_folder.is_dir():
-            target_file = map_folder / "target.npy"
-            obstacles_file = map_folder / "obstacles.npy"
-
-            if target_file.exists() and obstacles_file.exists():
-                maps[map_folder.name] = {
-                    'target': target_file,
-                    'obstacles': obstacles_file,
-                    'folder': map_folder
-                }
+        if map_folder.is_dir() and is_map_folder(map_folder):
+            maps[map_folder.name] = {'folder': map_folder}
 
     return maps
 
@@ -1,7 +1,8 @@
 """Base class for navigation algorithms."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
+import numpy as np
 from src.environment import Environment
 
 
@@ -26,6 +27,24 @@ class NavigationAlgorithm(ABC):
                 return 45.0  # Return angle in degrees
     """
 
+    # No per-instance __dict__ here, so subclasses that declare __slots__
+    # get slot-only instances
+    __slots__ = ()
+
+    # Whether each hook is overridden; the simulator skips calling the ones
+    # that are not. Set per subclass by __init_subclass__.
+    _has_reset = False
+    _has_on_collision = False
+    _has_on_target_reached = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._has_reset = cls.reset is not NavigationAlgorithm.reset
+        cls._has_on_collision = cls.on_collision is not NavigationAlgorithm.on_collision
+        cls._has_on_target_reached = (
+            cls.on_target_reached is not NavigationAlgorithm.on_target_reached
+        )
+
     def __init__(self):
         """Initialize the navigation algorithm."""
         pass
@@ -63,6 +82,41 @@ class NavigationAlgorithm(ABC):
         """
         pass
 
+    def compute_direction_batch(
+        self,
+        robot_xs: np.ndarray,
+        robot_ys: np.ndarray,
+        robot_radius: float,
+        robot_headings: np.ndarray,
+        environment: Environment,
+        sonar: Optional[object] = None,
+    ) -> np.ndarray:
+        """
+        Compute directions for many robots in the same environment at once.
+
+        The default calls compute_direction once per robot. Override this
+        with NumPy array math if your algorithm can handle every robot in
+        a single call.
+
+        Args:
+            robot_xs: (N,) X positions of the robots
+            robot_ys: (N,) Y positions of the robots
+            robot_radius: Radius shared by the robots
+            robot_headings: (N,) current headings in degrees
+            environment: The environment containing obstacles and target
+            sonar: Optional sonar sensor object
+
+        Returns:
+            (N,) float64 angles in degrees, as compute_direction returns them
+        """
+        return np.array(
+            [
+                self.compute_direction(x, y, robot_radius, heading, environment, sonar)
+                for x, y, heading in zip(robot_xs, robot_ys, robot_headings)
+            ],
+            dtype=np.float64,
+        )
+
     def get_name(self) -> str:
         """
         Get the display name of this algorithm.
@@ -5,6 +5,13 @@ from typing import Optional
 from .base import NavigationAlgorithm
 from src.environment import Environment
 
+# The 45-degree directions, indexed by octant (angle + 22.5) // 45 mod 8
+_OCTANT_LUT = (0, 45, 90, 135, 180, 225, 270, 315)
+
+# Module-level aliases skip the math attribute lookup on every call
+_atan2 = math.atan2
+_degrees = math.degrees
+
 
 class SimpleTargetSeekingAlgorithm(NavigationAlgorithm):
     """
@@ -49,14 +56,8 @@ class SimpleTargetSeekingAlgorithm(NavigationAlgorithm):
         dx = environment.target.x - robot_x
         dy = environment.target.y - robot_y
 
-        angle_rad = math.atan2(dy, dx)
-        angle_deg = math.degrees(angle_rad)
-
-        # Normalize to 0-360
-        if angle_deg < 0:
-            angle_deg += 360
-
-        # Snap to nearest 45-degree angle (to match sonar directions)
-        angle_deg = round(angle_deg / 45) * 45
+        angle_deg = _degrees(_atan2(dy, dx))
 
-        return angle_deg % 360
+        # Snap to nearest 45-degree angle (to match sonar directions); the
+        # mask also maps negative angles into 0-360
+        return _OCTANT_LUT[int((angle_deg + 22.5) // 45) & 7]
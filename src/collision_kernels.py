@@ -0,0 +1,205 @@
+"""Batch collision kernels over flat obstacle arrays.
+
+These mirror Environment.check_collision / is_path_clear exactly, but test
+many paths in one call. Obstacles are passed as arrays:
+
+    circles:  (C, 3) float64 rows of (x, y, radius)
+    verts:    (V, 2) float64 polygon vertices, all polygons concatenated
+    offsets:  (P + 1,) int64 start of each polygon in verts, plus the end
+
+Walls are polygons tested without a safety margin, like check_collision.
+"""
+
+import math
+import numpy as np
+from src.jit import njit, NUMBA_AVAILABLE
+
+# Same steps and margin sample directions as Environment
+PATH_STEPS = 10
+_MARGIN_COS = np.array([math.cos(math.radians(a)) for a in range(0, 360, 45)])
+_MARGIN_SIN = np.array([math.sin(math.radians(a)) for a in range(0, 360, 45)])
+
+
+@njit(cache=True)
+def _point_in_polygon(x: float, y: float, verts: np.ndarray, start: int, end: int) -> bool:
+    """Ray-casting containment test for one polygon of the flat vertex array."""
+    n = end - start
+    inside = False
+    p1x = verts[start, 0]
+    p1y = verts[start, 1]
+    for k in range(1, n + 1):
+        j = start + k % n
+        p2x = verts[j, 0]
+        p2y = verts[j, 1]
+        if y > min(p1y, p2y) and y <= max(p1y, p2y) and x <= max(p1x, p2x):
+            # p1y != p2y here, since y lies in (min, max]
+            if p1x == p2x or x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x:
+                inside = not inside
+        p1x = p2x
+        p1y = p2y
+    return inside
+
+
+@njit(cache=True)
+def first_polygon_containing(
+    x: float, y: float, verts: np.ndarray, offsets: np.ndarray, candidates: np.ndarray
+) -> int:
+    """
+    First polygon among candidates (ascending polygon indices) that contains
+    (x, y), or -1. Candidates usually come from a bounding-box prefilter.
+    """
+    for c in candidates:
+        if _point_in_polygon(x, y, verts, offsets[c], offsets[c + 1]):
+            return int(c)
+    return -1
+
+
+@njit(cache=True)
+def _point_collides(
+    x: float,
+    y: float,
+    margin: float,
+    circles: np.ndarray,
+    wall_verts: np.ndarray,
+    wall_offsets: np.ndarray,
+    poly_verts: np.ndarray,
+    poly_offsets: np.ndarray,
+    margin_cos: np.ndarray,
+    margin_sin: np.ndarray,
+) -> bool:
+    """Single-point equivalent of Environment.check_collision."""
+    for w in range(wall_offsets.shape[0] - 1):
+        if _point_in_polygon(x, y, wall_verts, wall_offsets[w], wall_offsets[w + 1]):
+            return True
+
+    for c in range(circles.shape[0]):
+        dx = x - circles[c, 0]
+        dy = y - circles[c, 1]
+        if math.sqrt(dx * dx + dy * dy) <= circles[c, 2] + margin:
+            return True
+
+    for p in range(poly_offsets.shape[0] - 1):
+        start = poly_offsets[p]
+        end = poly_offsets[p + 1]
+        if _point_in_polygon(x, y, poly_verts, start, end):
+            return True
+        if margin > 0:
+            for k in range(margin_cos.shape[0]):
+                if _point_in_polygon(
+                    x + margin * margin_cos[k],
+                    y + margin * margin_sin[k],
+                    poly_verts,
+                    start,
+                    end,
+                ):
+                    return True
+    return False
+
+
+@njit(cache=True)
+def _paths_clear_jit(
+    x1: float,
+    y1: float,
+    end_xs: np.ndarray,
+    end_ys: np.ndarray,
+    margin: float,
+    circles: np.ndarray,
+    wall_verts: np.ndarray,
+    wall_offsets: np.ndarray,
+    poly_verts: np.ndarray,
+    poly_offsets: np.ndarray,
+) -> np.ndarray:
+    """Compiled per-path scan; see paths_clear."""
+    clear = np.ones(end_xs.shape[0], dtype=np.bool_)
+    for b in range(end_xs.shape[0]):
+        for i in range(PATH_STEPS + 1):
+            t = i / PATH_STEPS
+            x = x1 + t * (end_xs[b] - x1)
+            y = y1 + t * (end_ys[b] - y1)
+            if _point_collides(
+                x,
+                y,
+                margin,
+                circles,
+                wall_verts,
+                wall_offsets,
+                poly_verts,
+                poly_offsets,
+                _MARGIN_COS,
+                _MARGIN_SIN,
+            ):
+                clear[b] = False
+                break
+    return clear
+
+
+def points_in_polygons(
+    xs: np.ndarray, ys: np.ndarray, verts: np.ndarray, offsets: np.ndarray
+) -> np.ndarray:
+    """
+    Containment of many points in many polygons at once.
+
+    Returns a (points, polygons) boolean array. Every edge of every polygon is
+    tested against every point in one broadcast, and crossings are summed per
+    polygon (odd count = inside).
+    """
+    if offsets.shape[0] < 2:
+        return np.zeros((xs.shape[0], 0), dtype=np.bool_)
+
+    # Each vertex paired with the next one in its own polygon
+    nxt = np.arange(1, verts.shape[0] + 1)
+    nxt[offsets[1:] - 1] = offsets[:-1]
+    p1x, p1y = verts[:, 0], verts[:, 1]
+    p2x, p2y = verts[nxt, 0], verts[nxt, 1]
+
+    x = xs[:, None]
+    y = ys[:, None]
+    cross = (y > np.minimum(p1y, p2y)) & (y <= np.maximum(p1y, p2y))
+    cross &= x <= np.maximum(p1x, p2x)
+    # Horizontal edges never pass the test above, so a dummy divisor is safe
+    dy = np.where(p1y == p2y, 1.0, p2y - p1y)
+    xinters = (y - p1y) * (p2x - p1x) / dy + p1x
+    cross &= (p1x == p2x) | (x <= xinters)
+
+    inside: np.ndarray = np.add.reduceat(cross, offsets[:-1], axis=1) % 2 == 1
+    return inside
+
+
+def _paths_clear_numpy(
+    x1: float,
+    y1: float,
+    end_xs: np.ndarray,
+    end_ys: np.ndarray,
+    margin: float,
+    circles: np.ndarray,
+    wall_verts: np.ndarray,
+    wall_offsets: np.ndarray,
+    poly_verts: np.ndarray,
+    poly_offsets: np.ndarray,
+) -> np.ndarray:
+    """Vectorized equivalent of _paths_clear_jit; see paths_clear."""
+    t = np.arange(PATH_STEPS + 1) / PATH_STEPS
+    xs = (x1 + t[None, :] * (end_xs[:, None] - x1)).ravel()
+    ys = (y1 + t[None, :] * (end_ys[:, None] - y1)).ravel()
+
+    hit = points_in_polygons(xs, ys, wall_verts, wall_offsets).any(axis=1)
+
+    if circles.shape[0]:
+        dist = np.sqrt((xs[:, None] - circles[:, 0]) ** 2 + (ys[:, None] - circles[:, 1]) ** 2)
+        hit |= (dist <= circles[:, 2] + margin).any(axis=1)
+
+    if poly_offsets.shape[0] > 1:
+        hit |= points_in_polygons(xs, ys, poly_verts, poly_offsets).any(axis=1)
+        if margin > 0:
+            mx = (xs[:, None] + margin * _MARGIN_COS).ravel()
+            my = (ys[:, None] + margin * _MARGIN_SIN).ravel()
+            ring = points_in_polygons(mx, my, poly_verts, poly_offsets)
+            hit |= ring.reshape(xs.shape[0], -1).any(axis=1)
+
+    return np.logical_not(hit.reshape(end_xs.shape[0], PATH_STEPS + 1).any(axis=1))
+
+
+# Test straight paths from (x1, y1) to each (end_xs[i], end_ys[i]) against
+# the obstacle arrays, sampling like Environment.is_path_clear. Returns a
+# boolean array, True where the path is clear.
+paths_clear = _paths_clear_jit if NUMBA_AVAILABLE else _paths_clear_numpy
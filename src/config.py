@@ -71,6 +71,10 @@ OBSTACLE_CIRCLE_RADIUS = 45
 # Simulation settings
 MOVE_INTERVAL = 5  # Frames between movements
 
+# Path trace settings
+PATH_TRACE_MAX = 100  # Most recent path points kept for drawing
+PATH_TRACE_BANDS = 8  # Fade steps in the path trace, one polyline each
+
 
 @dataclass
 class SimulationState:
@@ -1,10 +1,19 @@
 """Environment module containing obstacles and targets."""
 
-from dataclasses import dataclass
-from typing import List, Tuple, Union
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Union
 import math
 import numpy as np
 from pathlib import Path
+from src.collision_kernels import paths_clear
+from src.config import OBSTACLE_CIRCLE_RADIUS
+from src.map_io import (
+    OBSTACLE_CIRCLE,
+    ObstacleSoA,
+    is_map_folder,
+    load_map_data,
+    pack_obstacles,
+)
 
 
 @dataclass
@@ -14,6 +23,13 @@ class Circle:
     x: float
     y: float
     radius: float
+    # Integer pixel coordinates for drawing, derived once at construction
+    int_center: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    int_radius: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.int_center = (int(self.x), int(self.y))
+        self.int_radius = int(self.radius)
 
     def contains_point(self, x: float, y: float) -> bool:
         """Check if a point is inside this circle."""
@@ -30,6 +46,13 @@ class Polygon:
     """Represents a polygon obstacle."""
 
     points: List[Tuple[float, float]]
+    # Integer pixel coordinates for drawing, derived once at construction
+    int_points: Tuple[Tuple[int, int], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.int_points = tuple((int(px), int(py)) for px, py in self.points)
 
     def contains_point(self, x: float, y: float) -> bool:
         """Check if a point is inside this polygon using ray casting."""
@@ -58,6 +81,9 @@ class Environment:
         self.target: Circle = Circle(0, 0, 0)
         self.robot_start: Tuple[float, float] = (350.0, 200.0)  # Default robot start position
         self.walls: List[Polygon] = []
+        self.version = 0  # Bumped whenever obstacles or target change
+        self._collision_arrays: Optional[Tuple[np.ndarray, ...]] = None
+        self._collision_version = -1
         self._create_boundary_walls()
 
     def _create_boundary_walls(self) -> None:
@@ -82,28 +108,30 @@ class Environment:
         """
         maps_dir = Path("maps")
         map_folder = maps_dir / map_name
-        target_file = map_folder / "target.npy"
-        start_file = map_folder / "start.npy"
-        obstacles_file = map_folder / "obstacles.npy"
 
-        if not target_file.exists() or not obstacles_file.exists():
+        if not is_map_folder(map_folder):
             print(f"Warning: Map '{map_name}' not found at {map_folder}/")
             return False
 
-        # Load robot start position if it exists
-        if start_file.exists():
-            try:
-                start_data = np.load(start_file, allow_pickle=True)
-                if len(start_data) > 0:
-                    self.robot_start = (float(start_data[0][0]), float(start_data[0][1]))
-            except Exception as e:
-                print(f"Warning: Could not load start position: {e}")
-                self.robot_start = (350.0, 200.0)
+        try:
+            # set_obstacles copies everything out, so the files can be mapped
+            data = load_map_data(map_folder, mmap_mode="r")
+        except Exception as e:
+            print(f"Warning: Could not load map: {e}")
+            return False
+        if data is None:
+            print(f"Warning: Map '{map_name}' has no target or obstacles")
+            return False
+
+        # Use the default start position if the map has none
+        if data.start is not None and len(data.start) > 0:
+            self.robot_start = (float(data.start[0][0]), float(data.start[0][1]))
         else:
-            # Use default if no start position file
             self.robot_start = (350.0, 200.0)
 
-        return self.load_from_numpy(str(target_file), str(obstacles_file))
+        self._set_target(data.target)
+        self.set_obstacles(data.obstacles)
+        return True
 
     @staticmethod
     def get_available_maps() -> List[str]:
@@ -118,11 +146,8 @@ class Environment:
 
         maps = []
         for map_folder in maps_dir.iterdir():
-            if map_folder.is_dir():
-                target_file = map_folder / "target.npy"
-                obstacles_file = map_folder / "obstacles.npy"
-                if target_file.exists() and obstacles_file.exists():
-                    maps.append(map_folder.name)
+            if map_folder.is_dir() and is_map_folder(map_folder):
+                maps.append(map_folder.name)
 
         return sorted(maps)
 
@@ -132,34 +157,49 @@ class Environment:
         Returns:
             True if loaded successfully, False otherwise
         """
+        if not self._load_target(target_file):
+            return False
+
         try:
-            target_data = np.load(target_file, allow_pickle=True)
-            if len(target_data) > 0:
-                self.target = Circle(
-                    float(target_data[0][0]), float(target_data[0][1]), 25.0
-                )
+            obstacles = pack_obstacles(np.load(obstacles_file, allow_pickle=True))
         except Exception as e:
-            print(f"Warning: Could not load target file: {e}")
-            self.target = Circle(600.0, 600.0, 25.0)
+            print(f"Warning: Could not load obstacles file: {e}")
             return False
 
+        self.set_obstacles(obstacles)
+        return True
+
+    def _load_target(self, target_file: str) -> bool:
+        """Load the target position, falling back to a default on failure."""
         try:
-            obstacle_data = np.load(obstacles_file, allow_pickle=True)
-            self.obstacles.clear()
-
-            for obstacle in obstacle_data:
-                if len(obstacle) == 2:
-                    # It's a circle (just x, y coordinates)
-                    self.obstacles.append(Circle(float(obstacle[0]), float(obstacle[1]), 45.0))
-                else:
-                    # It's a polygon (list of points)
-                    points = [(float(obstacle[i]), float(obstacle[i + 1]))
-                             for i in range(0, len(obstacle), 2)]
-                    self.obstacles.append(Polygon(points))
-            return True
+            self._set_target(np.load(target_file, allow_pickle=False))
         except Exception as e:
-            print(f"Warning: Could not load obstacles file: {e}")
+            print(f"Warning: Could not load target file: {e}")
+            self.version += 1
+            self.target = Circle(600.0, 600.0, 25.0)
             return False
+        return True
+
+    def _set_target(self, target_data: np.ndarray) -> None:
+        """Place the target from a [[x, y]] array (left unchanged if empty)."""
+        self.version += 1
+        if len(target_data) > 0:
+            self.target = Circle(float(target_data[0][0]), float(target_data[0][1]), 25.0)
+
+    def set_obstacles(self, obstacles: ObstacleSoA) -> None:
+        """Replace the obstacles with those in an ObstacleSoA."""
+        self.version += 1
+        self.obstacles.clear()
+
+        verts = obstacles.verts.tolist()
+        offsets = obstacles.offsets.tolist()
+        for kind, start, end in zip(obstacles.kind.tolist(), offsets[:-1], offsets[1:]):
+            if kind == OBSTACLE_CIRCLE:
+                # Circles store only their center
+                x, y = verts[start]
+                self.obstacles.append(Circle(x, y, float(OBSTACLE_CIRCLE_RADIUS)))
+            else:
+                self.obstacles.append(Polygon([(x, y) for x, y in verts[start:end]]))
 
     def check_collision(self, x: float, y: float, safety_margin: float = 0) -> bool:
         """
@@ -198,6 +238,55 @@ class Environment:
 
         return False
 
+    def collision_arrays(self) -> Tuple[np.ndarray, ...]:
+        """
+        Obstacles and walls as flat arrays for the batch collision kernels.
+
+        Returns:
+            (circles, wall_verts, wall_offsets, poly_verts, poly_offsets), see
+            src/collision_kernels.py. Rebuilt only when the version changes.
+        """
+        arrays = self._collision_arrays
+        if arrays is None or self._collision_version != self.version:
+            circles = [(o.x, o.y, o.radius) for o in self.obstacles if isinstance(o, Circle)]
+            polygons = [o for o in self.obstacles if isinstance(o, Polygon)]
+            arrays = (
+                np.array(circles, dtype=np.float64).reshape(-1, 3),
+                *_flatten_polygons(self.walls),
+                *_flatten_polygons(polygons),
+            )
+            self._collision_arrays = arrays
+            self._collision_version = self.version
+        return arrays
+
+    def paths_clear(
+        self,
+        x1: float,
+        y1: float,
+        end_xs: np.ndarray,
+        end_ys: np.ndarray,
+        safety_margin: float = 0,
+    ) -> np.ndarray:
+        """
+        Batch version of is_path_clear for paths sharing a start point.
+
+        Args:
+            x1, y1: Start position
+            end_xs, end_ys: End positions, one per path
+            safety_margin: Additional distance to maintain from obstacles (e.g., robot radius)
+
+        Returns:
+            Boolean array, True where the path is clear
+        """
+        return paths_clear(
+            float(x1),
+            float(y1),
+            np.asarray(end_xs, dtype=np.float64),
+            np.asarray(end_ys, dtype=np.float64),
+            float(safety_margin),
+            *self.collision_arrays(),
+        )
+
     def is_path_clear(self, x1: float, y1: float, x2: float, y2: float, safety_margin: float = 0) -> bool:
         """
         Check if a straight line path is clear of obstacles.
@@ -216,3 +305,14 @@ class Environment:
             if self.check_collision(x, y, safety_margin):
                 return False
         return True
+
+
+def _flatten_polygons(polygons: List[Polygon]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate polygon vertices into one (V, 2) array plus start offsets."""
+    counts = [len(p.points) for p in polygons]
+    offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    verts = np.array(
+        [pt for p in polygons for pt in p.points], dtype=np.float64
+    ).reshape(-1, 2)
+    return verts, offsets
@@ -293,39 +293,38 @@ class ReactiveNavEnv(gym.Env):
                     pygame.draw.circle(
                         self.screen,
                         (71, 85, 105),  # Dark gray
-                        (int(obstacle.x), int(obstacle.y)),
-                        int(obstacle.radius),
+                        obstacle.int_center,
+                        obstacle.int_radius,
                     )
                     pygame.draw.circle(
                         self.screen,
                         (51, 65, 85),
-                        (int(obstacle.x), int(obstacle.y)),
-                        int(obstacle.radius),
+                        obstacle.int_center,
+                        obstacle.int_radius,
                         2,
                     )
                 elif isinstance(obstacle, Polygon):
-                    points = [(int(p[0]), int(p[1])) for p in obstacle.points]
+                    points = obstacle.int_points
                     pygame.draw.polygon(self.screen, (71, 85, 105), points)
                     pygame.draw.polygon(self.screen, (51, 65, 85), points, 2)
 
             # Draw walls
             for wall in self.environment.walls:
-                points = [(int(p[0]), int(p[1])) for p in wall.points]
-                pygame.draw.polygon(self.screen, (100, 100, 100), points)
+                pygame.draw.polygon(self.screen, (100, 100, 100), wall.int_points)
 
             # Draw target
             target = self.environment.target
             pygame.draw.circle(
                 self.screen,
                 (251, 191, 36),  # Amber
-                (int(target.x), int(target.y)),
-                int(target.radius),
+                target.int_center,
+                target.int_radius,
             )
             pygame.draw.circle(
                 self.screen,
                 (253, 224, 71),  # Yellow outline
-                (int(target.x), int(target.y)),
-                int(target.radius),
+                target.int_center,
+                target.int_radius,
                 3,
             )
 
@@ -0,0 +1,41 @@
+"""Optional Numba JIT support.
+
+Numeric kernels are decorated with ``njit`` from this module. When Numba is
+installed (``pip install numba``) they are compiled; otherwise the decorator
+is a no-op and the kernels run as plain Python.
+"""
+
+from typing import Any, Callable, Optional
+
+# Numba's decorators, or None when it is not installed
+_numba_cfunc: Optional[Callable[..., Any]]
+_numba_njit: Optional[Callable[..., Any]]
+try:
+    from numba import cfunc as _numba_cfunc, njit as _numba_njit
+except ImportError:
+    _numba_cfunc = _numba_njit = None
+
+NUMBA_AVAILABLE = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """Compile with numba.njit if available, otherwise return the function unchanged."""
+    if _numba_njit is not None:
+        compiled: Callable = _numba_njit(*args, **kwargs)
+        return compiled
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        func: Callable = args[0]
+        return func
+    return lambda func: func
+
+
+def cfunc(signature: str, **kwargs: Any) -> Callable:
+    """
+    Compile to a C callback with numba.cfunc if available, otherwise return
+    the function unchanged. Compiled callbacks expose their C function
+    pointer as ``.address``; check NUMBA_AVAILABLE before using it.
+    """
+    if _numba_cfunc is not None:
+        compiled: Callable = _numba_cfunc(signature, **kwargs)
+        return compiled
+    return lambda func: func
@@ -148,8 +148,8 @@ class Simulator:
             print(f"Path tracking {'enabled' if self.state.tracking_enabled else 'disabled'}")
 
         elif button_name == "save":
-            self.robot.save_path("robot_trace.npy")
-            print("Path saved to robot_trace.npy")
+            self.robot.save_path("robot_trace.npz")
+            print("Path saved to robot_trace.npz")
 
         elif button_name == "reset":
             self._reset_simulation()
@@ -177,10 +177,11 @@ class Simulator:
         self.robot.x = float(start_x)
         self.robot.y = float(start_y)
         self.robot.heading = 0.0
-        self.robot.path_trace = []
+        self.robot.clear_path()
         self.state.running = False
         self.state.target_reached = False
-        self.robot.algorithm.reset()
+        if self.robot.algorithm._has_reset:
+            self.robot.algorithm.reset()
         print(f"Simulation reset (robot at {start_x}, {start_y})")
 
     def update(self) -> None:
@@ -197,6 +198,8 @@ class Simulator:
                 print("Target reached!")
                 self.state.target_reached = True
                 self.state.running = False
+                if self.robot.algorithm._has_on_target_reached:
+                    self.robot.algorithm.on_target_reached()
 
         # Move robot if simulation is running
         if self.state.running and not self.state.target_reached:
@@ -211,6 +214,10 @@ class Simulator:
 
     def render(self) -> None:
         """Render the simulation."""
+        # Nothing to present while the window is minimized
+        if not pygame.display.get_active():
+            return
+
         # Draw environment
         sonar_beams = self.robot.sonar.beams if self.state.sonar_enabled else None
         self.renderer.draw_environment(
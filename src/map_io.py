@@ -0,0 +1,258 @@
+"""Reading and writing map obstacle data.
+
+Obstacles are stored as three aligned arrays (structure of arrays):
+
+    verts.npy    (V, 2) float32  vertices of all obstacles, concatenated
+    offsets.npy  (N + 1,) int32  obstacle i owns verts[offsets[i]:offsets[i + 1]]
+    kind.npy     (N,) uint8      OBSTACLE_CIRCLE or OBSTACLE_POLYGON
+
+A circle owns a single vertex, its center; its radius is
+OBSTACLE_CIRCLE_RADIUS. Map folders written before this format have a single
+pickled obstacles.npy of flat coordinate lists, which is still read.
+
+Alongside the obstacles, save_obstacles writes their bounding boxes for
+broad-phase collision tests:
+
+    aabb.npy        (N, 4) float32  [xmin, ymin, xmax, ymax] per obstacle
+    aabb_order.npy  (N,) int32      obstacle indices sorted by xmin
+
+All of these are plain numeric arrays written without pickle (see save_array),
+so they can be loaded with allow_pickle=False and memory-mapped.
+
+save_map_archive instead bundles a map's target, start and obstacle arrays
+into one compressed map.npz (keys target, start, verts, offsets, kind). Readers
+take each part from its own .npy file when present and from map.npz otherwise.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Literal, NamedTuple, Optional, Sequence, Union
+import numpy as np
+from numpy.typing import ArrayLike
+from src.config import OBSTACLE_CIRCLE_RADIUS
+
+OBSTACLE_CIRCLE = 0
+OBSTACLE_POLYGON = 1
+
+OBSTACLE_FILES = ("verts.npy", "offsets.npy", "kind.npy")
+LEGACY_OBSTACLES_FILE = "obstacles.npy"
+AABB_FILE = "aabb.npy"
+AABB_ORDER_FILE = "aabb_order.npy"
+MAP_ARCHIVE = "map.npz"
+
+PathLike = Union[str, Path]
+MmapMode = Optional[Literal["r+", "r", "w+", "c"]]
+
+
+class ObstacleSoA(NamedTuple):
+    """Obstacles of a map as flat arrays; see the module docstring."""
+
+    verts: np.ndarray
+    offsets: np.ndarray
+    kind: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+
+class MapData(NamedTuple):
+    """A map's contents as read by load_map_data."""
+
+    target: np.ndarray  # (1, 2) [[x, y]]
+    obstacles: ObstacleSoA
+    start: Optional[np.ndarray]  # (1, 2) [[x, y]], or None if the map has none
+
+
+def _numeric(path: PathLike, arr: ArrayLike) -> np.ndarray:
+    """arr as an ndarray, refusing object arrays that would need pickle."""
+    result: np.ndarray = np.asarray(arr)
+    if result.dtype == object:
+        raise ValueError(f"{path}: object arrays cannot be saved without pickle")
+    return result
+
+
+def save_array(path: PathLike, arr: ArrayLike) -> None:
+    """np.save a numeric array, refusing object arrays that would need pickle."""
+    np.save(path, _numeric(path, arr), allow_pickle=False)
+
+
+def pack_obstacles(obstacles: Sequence[Sequence[float]]) -> ObstacleSoA:
+    """
+    Convert flat obstacle lists to an ObstacleSoA.
+
+    Args:
+        obstacles: [x, y] for a circle, [x1, y1, x2, y2, ...] for a polygon
+    """
+    flat = [np.asarray(obs, dtype=np.float32).reshape(-1, 2) for obs in obstacles]
+    verts = np.concatenate(flat) if flat else np.empty((0, 2), dtype=np.float32)
+    offsets = np.zeros(len(flat) + 1, dtype=np.int32)
+    np.cumsum([len(v) for v in flat], out=offsets[1:])
+    kind = np.array(
+        [OBSTACLE_CIRCLE if len(v) == 1 else OBSTACLE_POLYGON for v in flat],
+        dtype=np.uint8,
+    )
+    return ObstacleSoA(verts, offsets, kind)
+
+
+def unpack_obstacles(soa: ObstacleSoA) -> List[List[float]]:
+    """Convert an ObstacleSoA back to flat obstacle lists."""
+    verts = soa.verts.tolist()
+    offsets = soa.offsets.tolist()
+    return [
+        [c for vert in verts[start:end] for c in vert]
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+
+
+def obstacle_aabbs(soa: ObstacleSoA) -> np.ndarray:
+    """Bounding box [xmin, ymin, xmax, ymax] of each obstacle, as (N, 4) float32."""
+    if len(soa) == 0:
+        return np.empty((0, 4), dtype=np.float32)
+    starts = soa.offsets[:-1]
+    aabb = np.concatenate(
+        (np.minimum.reduceat(soa.verts, starts), np.maximum.reduceat(soa.verts, starts)),
+        axis=1,
+    )
+    # A circle's single vertex is its center
+    circles = soa.kind == OBSTACLE_CIRCLE
+    aabb[circles, :2] -= OBSTACLE_CIRCLE_RADIUS
+    aabb[circles, 2:] += OBSTACLE_CIRCLE_RADIUS
+    return aabb
+
+
+def has_obstacles(map_folder: PathLike) -> bool:
+    """Whether map_folder holds obstacle data in any format."""
+    map_folder = Path(map_folder)
+    if all((map_folder / name).exists() for name in OBSTACLE_FILES):
+        return True
+    return (map_folder / LEGACY_OBSTACLES_FILE).exists() or (map_folder / MAP_ARCHIVE).exists()
+
+
+def is_map_folder(map_folder: PathLike) -> bool:
+    """Whether map_folder holds a loadable map (a target plus obstacles)."""
+    map_folder = Path(map_folder)
+    has_target = (map_folder / "target.npy").exists() or (map_folder / MAP_ARCHIVE).exists()
+    return has_target and has_obstacles(map_folder)
+
+
+def _save_aabbs(map_folder: Path, soa: ObstacleSoA) -> None:
+    """Write the bounding-box files for soa."""
+    aabb = obstacle_aabbs(soa)
+    save_array(map_folder / AABB_FILE, aabb)
+    save_array(map_folder / AABB_ORDER_FILE, np.argsort(aabb[:, 0], kind="stable").astype(np.int32))
+
+
+def save_obstacles(map_folder: PathLike, soa: ObstacleSoA) -> None:
+    """
+    Write obstacles and their bounding boxes to map_folder, replacing any
+    legacy obstacles.npy.
+    """
+    map_folder = Path(map_folder)
+    for name, arr in zip(OBSTACLE_FILES, soa):
+        save_array(map_folder / name, arr)
+    _save_aabbs(map_folder, soa)
+
+    legacy_file = map_folder / LEGACY_OBSTACLES_FILE
+    if legacy_file.exists():
+        legacy_file.unlink()
+
+
+def save_map_archive(
+    map_folder: PathLike,
+    target: Sequence[float],
+    soa: ObstacleSoA,
+    start: Optional[Sequence[float]] = None,
+) -> None:
+    """
+    Write a map's target, start and obstacles to one compressed map.npz.
+
+    Bounding boxes are written alongside as usual. Separate target/start/
+    obstacle .npy files left from an earlier save are removed, since they
+    would take precedence over the archive.
+    """
+    map_folder = Path(map_folder)
+    path = map_folder / MAP_ARCHIVE
+    arrays = {"target": np.asarray(target).reshape(-1, 2)}
+    if start is not None:
+        arrays["start"] = np.asarray(start).reshape(-1, 2)
+    arrays.update(soa._asdict())
+    numeric = {key: _numeric(path, arr) for key, arr in arrays.items()}
+    # numpy's stub checks **kwds against its allow_pickle parameter
+    np.savez_compressed(path, **numeric)  # type: ignore[arg-type]
+    _save_aabbs(map_folder, soa)
+
+    for name in ("target.npy", "start.npy", LEGACY_OBSTACLES_FILE) + OBSTACLE_FILES:
+        stale = map_folder / name
+        if stale.exists():
+            stale.unlink()
+
+
+def _read_archive(map_folder: Path) -> Dict[str, np.ndarray]:
+    """All arrays of the folder's map.npz, or {} if it has none."""
+    path = map_folder / MAP_ARCHIVE
+    if not path.exists():
+        return {}
+    with np.load(path, allow_pickle=False) as archive:
+        return {key: archive[key] for key in archive.files}
+
+
+def _load_separate_obstacles(map_folder: Path, mmap_mode: MmapMode) -> Optional[ObstacleSoA]:
+    """Obstacles from their own .npy files (either format), or None."""
+    if all((map_folder / name).exists() for name in OBSTACLE_FILES):
+        verts, offsets, kind = (
+            np.load(map_folder / name, mmap_mode=mmap_mode, allow_pickle=False)
+            for name in OBSTACLE_FILES
+        )
+        return ObstacleSoA(verts, offsets, kind)
+
+    legacy_file = map_folder / LEGACY_OBSTACLES_FILE
+    if legacy_file.exists():
+        return pack_obstacles(np.load(legacy_file, allow_pickle=True))
+    return None
+
+
+def _archive_obstacles(archive: Dict[str, np.ndarray]) -> Optional[ObstacleSoA]:
+    """Obstacles stored in a map.npz, or None."""
+    if not all(key in archive for key in ObstacleSoA._fields):
+        return None
+    return ObstacleSoA(*(archive[key] for key in ObstacleSoA._fields))
+
+
+def load_obstacles(map_folder: PathLike, mmap_mode: MmapMode = None) -> Optional[ObstacleSoA]:
+    """
+    Read obstacles from map_folder, or None if it has none.
+
+    Args:
+        mmap_mode: passed to np.load; "r" maps the arrays instead of reading
+            them, so callers must copy what they keep before the files are
+            rewritten. Legacy obstacles.npy files and map.npz are always read.
+    """
+    map_folder = Path(map_folder)
+    soa = _load_separate_obstacles(map_folder, mmap_mode)
+    if soa is None:
+        soa = _archive_obstacles(_read_archive(map_folder))
+    return soa
+
+
+def load_map_data(map_folder: PathLike, mmap_mode: MmapMode = None) -> Optional[MapData]:
+    """
+    Read a map's target, obstacles and start, or None if it lacks a target or
+    obstacles. map.npz is read at most once; see load_obstacles for mmap_mode,
+    which also applies to separate target.npy and start.npy files.
+    """
+    map_folder = Path(map_folder)
+    archive = _read_archive(map_folder)
+
+    def part(name: str) -> Optional[np.ndarray]:
+        path = map_folder / f"{name}.npy"
+        if path.exists():
+            arr: np.ndarray = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+            return arr
+        return archive.get(name)
+
+    target = part("target")
+    obstacles = _load_separate_obstacles(map_folder, mmap_mode)
+    if obstacles is None:
+        obstacles = _archive_obstacles(archive)
+    if target is None or obstacles is None:
+        return None
+    return MapData(target, obstacles, part("start"))
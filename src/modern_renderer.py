@@ -2,11 +2,11 @@
 
 import pygame
 import math
-from typing import Optional, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from src.robot import Robot
 from src.environment import Environment, Circle, Polygon
 from src.config import *
-from src.ui_components import ModernButton, Dropdown, ToggleSwitch, StatCard
+from src.ui_components import ModernButton, Dropdown, ToggleSwitch, StatCard, TextCache
 
 
 class ModernRenderer:
@@ -22,6 +22,30 @@ class ModernRenderer:
         self.font_large = pygame.font.Font(None, 28)
         self.font_medium = pygame.font.Font(None, 22)
         self.font_small = pygame.font.Font(None, 18)
+        self._text_cache = TextCache()
+
+        # Static UI panel layer, rebuilt when the map dropdown appears
+        self._panel_static: Optional[pygame.Surface] = None
+        self._panel_has_map: Optional[bool] = None
+        self._position_card: Optional[StatCard] = None
+        self._heading_card: Optional[StatCard] = None
+
+        # Obstacle draw functions keyed by obstacle type
+        self._obstacle_drawers: Dict[type, Callable[[pygame.Surface, Any], None]] = {
+            Circle: self._draw_circle_obstacle,
+            Polygon: self._draw_polygon_obstacle,
+        }
+
+        # Robot sprite, rendered on first draw
+        self._robot_sprite: Optional[pygame.Surface] = None
+        self._robot_sprite_radius: Optional[int] = None
+
+        # Cached static environment layer
+        self._env_bg = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT)).convert()
+        self._env_bg_key: Optional[Tuple[int, int]] = None
+
+        # Overlay reused by the fading path trace
+        self._trace_surf = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT), pygame.SRCALPHA)
 
         # UI Components
         self._create_ui_components()
@@ -57,6 +81,23 @@ class ModernRenderer:
                 570, button_y, 80, button_height, "Quit"
             ),
         }
+        # Fixed iteration order for the per-frame draw and event loops
+        self._button_items = tuple(self.buttons.items())
+        self._last_state_sig: Optional[Tuple[bool, bool, bool]] = None
+
+        # Hover hit-testing: reject motion outside the bar's bounding box,
+        # then scan only the row under the cursor
+        rects = [button.rect for _, button in self._button_items]
+        self._button_bbox = rects[0].unionall(rects[1:])
+        rows: Dict[Tuple[int, int], List[Tuple[int, int, ModernButton]]] = {}
+        for _, button in self._button_items:
+            rows.setdefault((button.rect.top, button.rect.bottom), []).append(
+                (button.rect.left, button.rect.right, button)
+            )
+        self._button_rows = tuple(
+            (top, bottom, tuple(row)) for (top, bottom), row in rows.items()
+        )
+        self._hovered_button: Optional[ModernButton] = None
 
         # Dropdowns (will be initialized with actual data)
         self.algorithm_dropdown = None
@@ -96,74 +137,94 @@ class ModernRenderer:
         self, environment: Environment, show_sonar: bool = False, sonar_beams=None
     ) -> None:
         """Draw the environment with modern styling."""
+        # Static layers (background, grid, obstacles, walls) come from a cached
+        # surface that is re-rendered only when the environment changes
+        env_key = (id(environment), environment.version)
+        if env_key != self._env_bg_key:
+            self._render_env_background(environment)
+            self._env_bg_key = env_key
+        self.screen.blit(self._env_bg, (0, 0))
+
+        # Draw target with glow effect
+        self._draw_target(environment.target)
+
+        # Draw sonar beams
+        if show_sonar and sonar_beams:
+            self._draw_sonar_beams(sonar_beams, environment)
+
+    def _render_env_background(self, environment: Environment) -> None:
+        """Render the static part of the environment into the background surface."""
+        surface = self._env_bg
+
         # Draw canvas background with subtle gradient
         canvas_rect = pygame.Rect(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT)
-        pygame.draw.rect(self.screen, COLOR_CANVAS_BG, canvas_rect)
+        pygame.draw.rect(surface, COLOR_CANVAS_BG, canvas_rect)
 
         # Draw grid pattern for depth
-        self._draw_grid()
+        self._draw_grid(surface)
 
         # Draw obstacles with shadows and modern styling
+        drawers = self._obstacle_drawers
         for obstacle in environment.obstacles:
-            if isinstance(obstacle, Circle):
-                # Shadow
-                shadow_offset = 3
-                pygame.draw.circle(
-                    self.screen,
-                    (0, 0, 0, 30),
-                    (int(obstacle.x + shadow_offset), int(obstacle.y + shadow_offset)),
-                    int(obstacle.radius),
-                )
-                # Obstacle
-                pygame.draw.circle(
-                    self.screen,
-                    COLOR_OBSTACLE,
-                    (int(obstacle.x), int(obstacle.y)),
-                    int(obstacle.radius),
-                )
-                # Outline
-                pygame.draw.circle(
-                    self.screen,
-                    COLOR_OBSTACLE_OUTLINE,
-                    (int(obstacle.x), int(obstacle.y)),
-                    int(obstacle.radius),
-                    3,
-                )
-            elif isinstance(obstacle, Polygon):
-                # Shadow
-                shadow_points = [(p[0] + 3, p[1] + 3) for p in obstacle.points]
-                pygame.draw.polygon(self.screen, (0, 0, 0, 30), shadow_points)
-                # Obstacle
-                pygame.draw.polygon(self.screen, COLOR_OBSTACLE, obstacle.points)
-                # Outline
-                pygame.draw.polygon(
-                    self.screen, COLOR_OBSTACLE_OUTLINE, obstacle.points, 3
-                )
+            drawers[type(obstacle)](surface, obstacle)
 
         # Draw walls (boundaries)
         for wall in environment.walls:
-            pygame.draw.polygon(self.screen, COLOR_BG_LIGHT, wall.points)
+            pygame.draw.polygon(surface, COLOR_BG_LIGHT, wall.int_points)
 
-        # Draw target with glow effect
-        self._draw_target(environment.target)
+    @staticmethod
+    def _draw_circle_obstacle(surface: pygame.Surface, obstacle: Circle) -> None:
+        """Draw a circular obstacle with shadow and outline."""
+        # Shadow
+        shadow_offset = 3
+        pygame.draw.circle(
+            surface,
+            (0, 0, 0, 30),
+            (int(obstacle.x + shadow_offset), int(obstacle.y + shadow_offset)),
+            obstacle.int_radius,
+        )
+        # Obstacle
+        pygame.draw.circle(
+            surface,
+            COLOR_OBSTACLE,
+            obstacle.int_center,
+            obstacle.int_radius,
+        )
+        # Outline
+        pygame.draw.circle(
+            surface,
+            COLOR_OBSTACLE_OUTLINE,
+            obstacle.int_center,
+            obstacle.int_radius,
+            3,
+        )
 
-        # Draw sonar beams
-        if show_sonar and sonar_beams:
-            self._draw_sonar_beams(sonar_beams, environment)
+    @staticmethod
+    def _draw_polygon_obstacle(surface: pygame.Surface, obstacle: Polygon) -> None:
+        """Draw a polygon obstacle with shadow and outline."""
+        # Shadow
+        shadow_points = [(p[0] + 3, p[1] + 3) for p in obstacle.points]
+        pygame.draw.polygon(surface, (0, 0, 0, 30), shadow_points)
+        # Obstacle
+        pygame.draw.polygon(surface, COLOR_OBSTACLE, obstacle.int_points)
+        # Outline
+        pygame.draw.polygon(
+            surface, COLOR_OBSTACLE_OUTLINE, obstacle.int_points, 3
+        )
 
-    def _draw_grid(self) -> None:
+    def _draw_grid(self, surface: pygame.Surface) -> None:
         """Draw subtle grid pattern."""
         grid_color = (220, 220, 225)
         grid_spacing = 50
 
         for x in range(0, CANVAS_WIDTH, grid_spacing):
             pygame.draw.line(
-                self.screen, grid_color, (x, 0), (x, CANVAS_HEIGHT), 1
+                surface, grid_color, (x, 0), (x, CANVAS_HEIGHT), 1
             )
 
         for y in range(0, CANVAS_HEIGHT, grid_spacing):
             pygame.draw.line(
-                self.screen, grid_color, (0, y), (CANVAS_WIDTH, y), 1
+                surface, grid_color, (0, y), (CANVAS_WIDTH, y), 1
             )
 
     def _draw_target(self, target: Circle) -> None:
@@ -172,6 +233,8 @@ class ModernRenderer:
         self.target_pulse = (self.target_pulse + 0.05) % (2 * math.pi)
         pulse_factor = 0.8 + 0.2 * math.sin(self.target_pulse)
 
+        target_x, target_y = target.int_center
+
         # Outer glow (multiple layers)
         for i in range(4, 0, -1):
             glow_radius = int(target.radius * (1 + i * 0.3 * pulse_factor))
@@ -188,8 +251,8 @@ class ModernRenderer:
             self.screen.blit(
                 glow_surf,
                 (
-                    int(target.x - glow_radius),
-                    int(target.y - glow_radius),
+                    target_x - glow_radius,
+                    target_y - glow_radius,
                 ),
             )
 
@@ -197,8 +260,8 @@ class ModernRenderer:
         pygame.draw.circle(
             self.screen,
             COLOR_TARGET,
-            (int(target.x), int(target.y)),
-            int(target.radius),
+            (target_x, target_y),
+            target.int_radius,
         )
 
         # Inner circle
@@ -206,13 +269,13 @@ class ModernRenderer:
         pygame.draw.circle(
             self.screen,
             COLOR_TARGET_GLOW,
-            (int(target.x), int(target.y)),
+            (target_x, target_y),
             inner_radius,
         )
 
         # Center dot
         pygame.draw.circle(
-            self.screen, COLOR_WHITE, (int(target.x), int(target.y)), 4
+            self.screen, COLOR_WHITE, (target_x, target_y), 4
         )
 
     def _draw_sonar_beams(self, beams, environment) -> None:
@@ -225,36 +288,23 @@ class ModernRenderer:
             color = COLOR_SONAR_LINE if is_clear else COLOR_SONAR_BLOCKED
 
             # Draw beam with alpha
-            pygame.draw.aaline(self.screen, color, (int(x1), int(y1)), (int(x2), int(y2)), 2)
+            pygame.draw.aaline(self.screen, color, (x1, y1), (x2, y2), 2)
 
             # Draw endpoint indicator
-            pygame.draw.circle(self.screen, color, (int(x2), int(y2)), 4)
+            pygame.draw.circle(self.screen, color, (x2, y2), 4)
 
     def draw_robot(self, robot: Robot) -> None:
         """Draw robot with modern styling and direction indicator."""
         robot_x, robot_y = int(robot.x), int(robot.y)
         radius = robot.radius
 
-        # Shadow
-        shadow_offset = 2
-        shadow_surf = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
-        pygame.draw.circle(
-            shadow_surf,
-            (0, 0, 0, 60),
-            (radius + 5 + shadow_offset, radius + 5 + shadow_offset),
-            radius,
-        )
-        self.screen.blit(
-            shadow_surf, (robot_x - radius - 5, robot_y - radius - 5)
-        )
-
-        # Robot body
-        pygame.draw.circle(self.screen, COLOR_ROBOT, (robot_x, robot_y), radius)
-
-        # Robot outline
-        pygame.draw.circle(
-            self.screen, COLOR_ACCENT_SECONDARY, (robot_x, robot_y), radius, 3
-        )
+        # Shadow, body and outline come from a pre-rendered sprite
+        sprite = self._robot_sprite
+        if sprite is None or radius != self._robot_sprite_radius:
+            sprite = self._render_robot_sprite(radius)
+            self._robot_sprite = sprite
+            self._robot_sprite_radius = radius
+        self.screen.blit(sprite, (robot_x - radius - 5, robot_y - radius - 5))
 
         # Direction indicator
         angle_rad = math.radians(robot.heading)
@@ -273,27 +323,59 @@ class ModernRenderer:
         # Center dot
         pygame.draw.circle(self.screen, COLOR_WHITE, (robot_x, robot_y), 3)
 
+    @staticmethod
+    def _render_robot_sprite(radius: int) -> pygame.Surface:
+        """Render the robot's shadow, body and outline into a sprite."""
+        size = radius * 2 + 10
+        center = (radius + 5, radius + 5)
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        # Shadow
+        shadow_offset = 2
+        pygame.draw.circle(
+            sprite,
+            (0, 0, 0, 60),
+            (center[0] + shadow_offset, center[1] + shadow_offset),
+            radius,
+        )
+
+        # Robot body
+        pygame.draw.circle(sprite, COLOR_ROBOT, center, radius)
+
+        # Robot outline
+        pygame.draw.circle(sprite, COLOR_ACCENT_SECONDARY, center, radius, 3)
+        return sprite
+
     def draw_path_trace(self, robot: Robot) -> None:
         """Draw the robot's path trace with gradient effect."""
-        if len(robot.path_trace) < 2:
+        path_points = robot.recent_trace()  # Last PATH_TRACE_MAX points
+        num_points = len(path_points)
+        if num_points < 2:
             return
 
-        # Draw path with fading effect
-        path_points = robot.path_trace[-100:]  # Last 100 points
+        # Draw path with fading effect onto a reused overlay
+        self._trace_surf.fill((0, 0, 0, 0))
+        points = path_points.tolist()
 
-        for i in range(len(path_points) - 1):
-            # Calculate alpha based on position in path (newer = more visible)
-            alpha = int(100 + (i / len(path_points)) * 155)
-            thickness = 2 + int((i / len(path_points)) * 2)
+        # The fade is stepped in bands so each band is a single polyline
+        num_segments = num_points - 1
+        for band in range(PATH_TRACE_BANDS):
+            start = band * num_segments // PATH_TRACE_BANDS
+            end = (band + 1) * num_segments // PATH_TRACE_BANDS
+            if end <= start:
+                continue
 
-            p1 = (int(path_points[i][0]), int(path_points[i][1]))
-            p2 = (int(path_points[i + 1][0]), int(path_points[i + 1][1]))
+            # Calculate alpha based on position in path (newer = more visible)
+            alpha = int(100 + (start / num_points) * 155)
+            thickness = 2 + int((start / num_points) * 2)
 
-            # Draw segment
+            # Draw band
             color = (*COLOR_PATH_TRACE, alpha)
-            surf = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.line(surf, color, p1, p2, thickness)
-            self.screen.blit(surf, (0, 0))
+            pygame.draw.lines(
+                self._trace_surf, color, False, points[start:end + 1], thickness
+            )
+
+        self.screen.blit(self._trace_surf, (0, 0))
 
     def draw_ui_panel(self, robot: Robot, state, algorithm_name: str) -> None:
         """Draw modern UI panel."""
@@ -301,25 +383,21 @@ class ModernRenderer:
         panel_width = WINDOW_WIDTH - CANVAS_WIDTH
         panel_height = CANVAS_HEIGHT
 
-        # Draw panel background
-        pygame.draw.rect(
-            self.screen,
-            COLOR_UI_BG,
-            (panel_x, 0, panel_width, panel_height),
-        )
-
-        # Draw title
-        title_surface = self.font_title.render("Navigation", True, COLOR_TEXT_PRIMARY)
-        self.screen.blit(title_surface, (panel_x + 20, 20))
-
-        # Algorithm dropdown label (draw dropdown itself later, on top)
-        algo_label = self.font_small.render("Algorithm:", True, COLOR_TEXT_SECONDARY)
-        self.screen.blit(algo_label, (panel_x + 20, 65))
-
-        # Map dropdown label (draw dropdown itself later, on top)
-        if self.map_dropdown:
-            map_label = self.font_small.render("Map:", True, COLOR_TEXT_SECONDARY)
-            self.screen.blit(map_label, (panel_x + 20, 135))
+        # Draw background, title and labels from the cached static layer
+        has_map = self.map_dropdown is not None
+        panel = self._panel_static
+        position_card = self._position_card
+        heading_card = self._heading_card
+        if (
+            panel is None
+            or position_card is None
+            or heading_card is None
+            or has_map != self._panel_has_map
+        ):
+            panel = self._render_panel_static(has_map)
+            position_card, heading_card = self._create_stat_cards(has_map)
+            self._panel_has_map = has_map
+        self.screen.blit(panel, (panel_x, 0))
 
         # Stats section
         stats_y = 200 if self.map_dropdown else 130  # Adjusted to fit below both dropdowns or just algorithm
@@ -327,32 +405,16 @@ class ModernRenderer:
         stat_spacing = 15
 
         # Position stat
-        StatCard(
-            panel_x + 20,
-            stats_y,
-            panel_width - 40,
-            stat_height,
-            "Position",
-            f"({robot.x:.0f}, {robot.y:.0f})",
-        ).draw(self.screen, self.font_small, self.font_medium)
+        position_card.update_value(f"({robot.x:.0f}, {robot.y:.0f})")
+        position_card.draw(self.screen, self.font_small, self.font_medium)
 
         # Heading stat
-        StatCard(
-            panel_x + 20,
-            stats_y + stat_height + stat_spacing,
-            panel_width - 40,
-            stat_height,
-            "Heading",
-            f"{robot.heading:.1f}°",
-        ).draw(self.screen, self.font_small, self.font_medium)
+        heading_card.update_value(f"{robot.heading:.1f}°")
+        heading_card.draw(self.screen, self.font_small, self.font_medium)
 
         # Status indicators
         status_y = stats_y + 2 * (stat_height + stat_spacing) + 30
 
-        # Draw status section header
-        status_header = self.font_medium.render("Status", True, COLOR_TEXT_PRIMARY)
-        self.screen.blit(status_header, (panel_x + 20, status_y - 30))
-
         # Status items
         status_items = [
             ("Running", state.running, COLOR_SUCCESS),
@@ -371,7 +433,7 @@ class ModernRenderer:
 
             # Label
             text_color = COLOR_TEXT_PRIMARY if active else COLOR_TEXT_SECONDARY
-            text = self.font_small.render(label, True, text_color)
+            text = self._text_cache.render(self.font_small, label, text_color)
             self.screen.blit(text, (panel_x + 50, y_pos + 2))
 
         # Target reached message
@@ -380,10 +442,61 @@ class ModernRenderer:
             success_bg = pygame.Rect(panel_x + 20, msg_y, panel_width - 40, 50)
             pygame.draw.rect(self.screen, COLOR_SUCCESS, success_bg, border_radius=8)
 
-            msg_text = self.font_medium.render("TARGET REACHED!", True, COLOR_WHITE)
+            msg_text = self._text_cache.render(self.font_medium, "TARGET REACHED!", COLOR_WHITE)
             msg_rect = msg_text.get_rect(center=success_bg.center)
             self.screen.blit(msg_text, msg_rect)
 
+    def _create_stat_cards(self, has_map: bool) -> Tuple[StatCard, StatCard]:
+        """Create the position and heading cards for the current panel layout."""
+        panel_x = CANVAS_WIDTH
+        panel_width = WINDOW_WIDTH - CANVAS_WIDTH
+        stats_y = 200 if has_map else 130
+        stat_height = 70
+        stat_spacing = 15
+
+        position_card = StatCard(
+            panel_x + 20, stats_y, panel_width - 40, stat_height, "Position", ""
+        )
+        heading_card = StatCard(
+            panel_x + 20,
+            stats_y + stat_height + stat_spacing,
+            panel_width - 40,
+            stat_height,
+            "Heading",
+            "",
+        )
+        self._position_card = position_card
+        self._heading_card = heading_card
+        return position_card, heading_card
+
+    def _render_panel_static(self, has_map: bool) -> pygame.Surface:
+        """Render the panel background, title and section labels."""
+        panel_width = WINDOW_WIDTH - CANVAS_WIDTH
+        panel = pygame.Surface((panel_width, CANVAS_HEIGHT)).convert()
+        panel.fill(COLOR_UI_BG)
+
+        # Draw title
+        title_surface = self._text_cache.render(self.font_title, "Navigation", COLOR_TEXT_PRIMARY)
+        panel.blit(title_surface, (20, 20))
+
+        # Algorithm dropdown label (draw dropdown itself later, on top)
+        algo_label = self._text_cache.render(self.font_small, "Algorithm:", COLOR_TEXT_SECONDARY)
+        panel.blit(algo_label, (20, 65))
+
+        # Map dropdown label (draw dropdown itself later, on top)
+        if has_map:
+            map_label = self._text_cache.render(self.font_small, "Map:", COLOR_TEXT_SECONDARY)
+            panel.blit(map_label, (20, 135))
+
+        # Draw status section header
+        stats_y = 200 if has_map else 130
+        status_y = stats_y + 2 * (70 + 15) + 30
+        status_header = self._text_cache.render(self.font_medium, "Status", COLOR_TEXT_PRIMARY)
+        panel.blit(status_header, (20, status_y - 30))
+
+        self._panel_static = panel
+        return panel
+
     def draw_dropdown_on_top(self) -> None:
         """Draw dropdowns on top of everything else."""
         # Draw closed dropdowns first
@@ -414,14 +527,17 @@ class ModernRenderer:
         )
 
         # Draw buttons
-        for button in self.buttons.values():
+        for _, button in self._button_items:
             button.draw(self.screen, self.font_small)
 
     def handle_button_events(self, event: pygame.event.Event) -> Optional[str]:
         """Handle button click events. Returns button name if clicked."""
-        for name, button in self.buttons.items():
-            if button.handle_event(event):
-                return name
+        if event.type == pygame.MOUSEMOTION:
+            self._update_button_hover(event.pos)
+        else:
+            for name, button in self._button_items:
+                if button.handle_event(event):
+                    return name
 
         # Handle algorithm dropdown
         if self.algorithm_dropdown and self.algorithm_dropdown.handle_event(event):
@@ -433,8 +549,33 @@ class ModernRenderer:
 
         return None
 
+    def _update_button_hover(self, pos: Tuple[int, int]) -> None:
+        """Set the hover flag on the button under the cursor, if any."""
+        hovered = None
+        if self._button_bbox.collidepoint(pos):
+            x, y = pos
+            for top, bottom, row in self._button_rows:
+                if top <= y < bottom:
+                    for left, right, button in row:
+                        if left <= x < right:
+                            hovered = button
+                            break
+                    break
+
+        if hovered is not self._hovered_button:
+            if self._hovered_button is not None:
+                self._hovered_button.is_hovered = False
+            if hovered is not None:
+                hovered.is_hovered = True
+            self._hovered_button = hovered
+
     def update_button_states(self, state) -> None:
         """Update button active states based on simulation state."""
+        sig = (state.running, state.sonar_enabled, state.tracking_enabled)
+        if sig == self._last_state_sig:
+            return
+        self._last_state_sig = sig
+
         self.buttons["start_stop"].is_active = state.running
         self.buttons["sonar"].is_active = state.sonar_enabled
         self.buttons["tracking"].is_active = state.tracking_enabled
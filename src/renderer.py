@@ -1,9 +1,10 @@
 """Pygame-based renderer for the navigation simulator."""
 
 import pygame
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from src.robot import Robot
 from src.environment import Environment, Circle, Polygon
+from src.ui_components import GlyphAtlas, TextCache
 from src.config import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
@@ -25,6 +26,16 @@ from src.config import (
 )
 
 
+# UI panel fields: (label, gap from label to value, gap from value to next label)
+_PANEL_FIELDS = (
+    ("Position:", 25, 40),
+    ("Heading:", 25, 40),
+    ("Target Centric:", 30, 50),
+    ("Sonar:", 30, 50),
+    ("Tracking:", 30, 50),
+)
+
+
 class Button:
     """Simple button for the UI."""
 
@@ -32,16 +43,29 @@ class Button:
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.is_hovered = False
+        self._surfaces: Dict[bool, pygame.Surface] = {}  # is_hovered -> pre-rendered button
 
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw the button."""
+        surface = self._surfaces.get(self.is_hovered)
+        if surface is None:
+            surface = self._render(font)
+            self._surfaces[self.is_hovered] = surface
+        screen.blit(surface, self.rect)
+
+    def _render(self, font: pygame.font.Font) -> pygame.Surface:
+        """Render the button for the current hover state."""
+        surface = pygame.Surface(self.rect.size).convert()
+        local_rect = surface.get_rect()
+
         color = COLOR_BUTTON_ACTIVE if self.is_hovered else COLOR_BUTTON
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, COLOR_BLACK, self.rect, 2)
+        pygame.draw.rect(surface, color, local_rect)
+        pygame.draw.rect(surface, COLOR_BLACK, local_rect, 2)
 
         text_surface = font.render(self.text, True, COLOR_BLACK)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        surface.blit(text_surface, text_rect)
+        return surface
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events. Returns True if button was clicked."""
@@ -64,6 +88,32 @@ class Renderer:
         self.font_large = pygame.font.Font(None, 32)
         self.font_medium = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 20)
+        self._text_cache = TextCache()
+        self._value_glyphs = GlyphAtlas(self.font_small, COLOR_UI_TEXT)
+
+        # Pre-rendered path trace dot, blitted once per trace point
+        self._trace_dot = pygame.Surface((4, 4), pygame.SRCALPHA)
+        pygame.draw.circle(self._trace_dot, COLOR_PATH_TRACE, (2, 2), 2)
+        self._blit_many = getattr(self.screen, "fblits", None)
+
+        # Obstacle draw functions keyed by obstacle type
+        self._obstacle_drawers: Dict[type, Callable[[pygame.Surface, Any], None]] = {
+            Circle: self._draw_circle_obstacle,
+            Polygon: self._draw_polygon_obstacle,
+        }
+
+        # Robot sprite, rendered on first draw
+        self._robot_sprite: Optional[pygame.Surface] = None
+        self._robot_sprite_radius: Optional[int] = None
+
+        # Cached static environment layer
+        self._env_bg = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT)).convert()
+        self._env_bg_key: Optional[Tuple[int, int]] = None
+
+        # Static UI panel layer, rebuilt when its key changes
+        self._panel_static: Optional[pygame.Surface] = None
+        self._panel_key: Optional[Tuple[str, bool]] = None
+        self._panel_value_ys: List[int] = []
 
         # Create buttons
         button_y_top = WINDOW_HEIGHT - 110
@@ -84,146 +134,178 @@ class Renderer:
         self, environment: Environment, show_sonar: bool = False, sonar_beams=None
     ) -> None:
         """Draw the environment including walls, obstacles, and target."""
+        # Walls, obstacles and target are static; re-render them only when
+        # the environment changes
+        env_key = (id(environment), environment.version)
+        if env_key != self._env_bg_key:
+            self._render_env_background(environment)
+            self._env_bg_key = env_key
+        self.screen.blit(self._env_bg, (0, 0))
+
+        # Draw sonar beams if enabled, one antialiased line per beam (an
+        # aaline already covers the pixels a plain line would)
+        if show_sonar and sonar_beams:
+            aaline = pygame.draw.aaline
+            screen = self.screen
+            for x1, y1, x2, y2 in sonar_beams:
+                aaline(screen, COLOR_SONAR_LINE, (int(x1), int(y1)), (int(x2), int(y2)))
+
+    def _render_env_background(self, environment: Environment) -> None:
+        """Render walls, obstacles and target into the background surface."""
+        surface = self._env_bg
+
         # Clear canvas area
         pygame.draw.rect(
-            self.screen, COLOR_WHITE, (0, 0, CANVAS_WIDTH, CANVAS_HEIGHT)
+            surface, COLOR_WHITE, (0, 0, CANVAS_WIDTH, CANVAS_HEIGHT)
         )
 
         # Draw walls
         for wall in environment.walls:
-            pygame.draw.polygon(self.screen, COLOR_BLACK, wall.points)
+            pygame.draw.polygon(surface, COLOR_BLACK, wall.int_points)
 
         # Draw obstacles
+        drawers = self._obstacle_drawers
         for obstacle in environment.obstacles:
-            if isinstance(obstacle, Circle):
-                pygame.draw.circle(
-                    self.screen,
-                    COLOR_OBSTACLE,
-                    (int(obstacle.x), int(obstacle.y)),
-                    int(obstacle.radius),
-                )
-                pygame.draw.circle(
-                    self.screen,
-                    COLOR_OBSTACLE_OUTLINE,
-                    (int(obstacle.x), int(obstacle.y)),
-                    int(obstacle.radius),
-                    2,
-                )
-            elif isinstance(obstacle, Polygon):
-                pygame.draw.polygon(self.screen, COLOR_OBSTACLE, obstacle.points)
-                pygame.draw.polygon(self.screen, COLOR_OBSTACLE_OUTLINE, obstacle.points, 3)
+            drawers[type(obstacle)](surface, obstacle)
 
         # Draw target
         pygame.draw.circle(
-            self.screen,
+            surface,
             COLOR_TARGET,
-            (int(environment.target.x), int(environment.target.y)),
-            int(environment.target.radius),
+            environment.target.int_center,
+            environment.target.int_radius,
         )
 
-        # Draw sonar beams if enabled
-        if show_sonar and sonar_beams:
-            for beam in sonar_beams:
-                x1, y1, x2, y2 = beam
-                pygame.draw.line(
-                    self.screen, COLOR_SONAR_LINE, (int(x1), int(y1)), (int(x2), int(y2)), 1
-                )
-                pygame.draw.aaline(
-                    self.screen, COLOR_SONAR_LINE, (int(x1), int(y1)), (int(x2), int(y2))
-                )
-
-    def draw_robot(self, robot: Robot) -> None:
-        """Draw the robot."""
+    @staticmethod
+    def _draw_circle_obstacle(surface: pygame.Surface, obstacle: Circle) -> None:
+        """Draw a circular obstacle with its outline."""
         pygame.draw.circle(
-            self.screen, COLOR_ROBOT, (int(robot.x), int(robot.y)), robot.radius
+            surface,
+            COLOR_OBSTACLE,
+            obstacle.int_center,
+            obstacle.int_radius,
         )
         pygame.draw.circle(
-            self.screen, COLOR_BLACK, (int(robot.x), int(robot.y)), robot.radius, 2
+            surface,
+            COLOR_OBSTACLE_OUTLINE,
+            obstacle.int_center,
+            obstacle.int_radius,
+            2,
         )
 
+    @staticmethod
+    def _draw_polygon_obstacle(surface: pygame.Surface, obstacle: Polygon) -> None:
+        """Draw a polygon obstacle with its outline."""
+        pygame.draw.polygon(surface, COLOR_OBSTACLE, obstacle.int_points)
+        pygame.draw.polygon(surface, COLOR_OBSTACLE_OUTLINE, obstacle.int_points, 3)
+
+    def draw_robot(self, robot: Robot) -> None:
+        """Draw the robot."""
+        radius = robot.radius
+        sprite = self._robot_sprite
+        if sprite is None or radius != self._robot_sprite_radius:
+            sprite = self._render_robot_sprite(radius)
+            self._robot_sprite = sprite
+            self._robot_sprite_radius = radius
+        self.screen.blit(sprite, (int(robot.x) - radius - 2, int(robot.y) - radius - 2))
+
+    @staticmethod
+    def _render_robot_sprite(radius: int) -> pygame.Surface:
+        """Render the filled and outlined robot circle into a sprite."""
+        size = radius * 2 + 4
+        center = (radius + 2, radius + 2)
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, COLOR_ROBOT, center, radius)
+        pygame.draw.circle(sprite, COLOR_BLACK, center, radius, 2)
+        return sprite
+
     def draw_path_trace(self, robot: Robot) -> None:
         """Draw the robot's path trace."""
-        if len(robot.path_trace) < 2:
+        points = robot.trace_points()
+        if len(points) < 2:
             return
 
         # Draw lines connecting path points
-        for i in range(len(robot.path_trace) - 1):
-            start = (int(robot.path_trace[i][0]), int(robot.path_trace[i][1]))
-            end = (int(robot.path_trace[i + 1][0]), int(robot.path_trace[i + 1][1]))
-            pygame.draw.line(self.screen, COLOR_PATH_TRACE, start, end, 2)
+        pygame.draw.lines(self.screen, COLOR_PATH_TRACE, False, points, 2)
 
         # Draw dots at each position
-        for pos in robot.path_trace:
-            pygame.draw.circle(
-                self.screen, COLOR_PATH_TRACE, (int(pos[0]), int(pos[1])), 2
-            )
+        dot = self._trace_dot
+        dots = [(dot, (x - 2, y - 2)) for x, y in points]
+        if self._blit_many is not None:
+            self._blit_many(dots)
+        else:
+            self.screen.blits(dots, doreturn=False)
 
     def draw_ui_panel(self, robot: Robot, state: SimulationState) -> None:
         """Draw the UI panel on the right side."""
         panel_x = CANVAS_WIDTH + 10
-        panel_width = WINDOW_WIDTH - CANVAS_WIDTH - 20
 
-        # Background
-        pygame.draw.rect(
-            self.screen,
-            COLOR_UI_BG,
-            (CANVAS_WIDTH, 0, WINDOW_WIDTH - CANVAS_WIDTH, CANVAS_HEIGHT),
+        # Background, labels and algorithm name only change with this key
+        algo_name = robot.algorithm.get_name()
+        panel_key = (algo_name, state.target_reached)
+        panel = self._panel_static
+        if panel is None or panel_key != self._panel_key:
+            panel = self._render_panel_static(algo_name, state.target_reached)
+            self._panel_key = panel_key
+        self.screen.blit(panel, (CANVAS_WIDTH, 0))
+
+        # Dynamic values, in _PANEL_FIELDS order
+        values = (
+            f"({robot.x:.1f}, {robot.y:.1f})",
+            f"{robot.heading:.1f}°",
+            str(state.target_centric),
+            str(state.sonar_enabled),
+            str(state.tracking_enabled),
         )
+        glyphs = self._value_glyphs
+        for value, y_pos in zip(values, self._panel_value_ys):
+            # Numbers change every frame, so lay them out from cached glyphs
+            if glyphs.supports(value):
+                glyphs.draw(self.screen, value, (panel_x, y_pos))
+            else:
+                self.draw_text(value, panel_x, y_pos, self.font_small)
+
+    def _render_panel_static(self, algo_name: str, target_reached: bool) -> pygame.Surface:
+        """Render the static layer of the UI panel and record value positions."""
+        panel = pygame.Surface((WINDOW_WIDTH - CANVAS_WIDTH, CANVAS_HEIGHT)).convert()
+        panel.fill(COLOR_UI_BG)
+        text_x = 10
+        value_ys = []
 
         y_pos = 20
 
         # Algorithm
-        self.draw_text("Algorithm:", panel_x, y_pos, self.font_medium)
+        self.draw_text("Algorithm:", text_x, y_pos, self.font_medium, surface=panel)
         y_pos += 25
-        algo_name = robot.algorithm.get_name()
         # Wrap long algorithm names
         if len(algo_name) > 20:
             words = algo_name.split()
             line1 = " ".join(words[:len(words)//2])
             line2 = " ".join(words[len(words)//2:])
-            self.draw_text(line1, panel_x, y_pos, self.font_small)
+            self.draw_text(line1, text_x, y_pos, self.font_small, surface=panel)
             y_pos += 20
-            self.draw_text(line2, panel_x, y_pos, self.font_small)
+            self.draw_text(line2, text_x, y_pos, self.font_small, surface=panel)
             y_pos += 35
         else:
-            self.draw_text(algo_name, panel_x, y_pos, self.font_small)
+            self.draw_text(algo_name, text_x, y_pos, self.font_small, surface=panel)
             y_pos += 50
 
-        # Position
-        self.draw_text("Position:", panel_x, y_pos, self.font_medium)
-        y_pos += 25
-        pos_text = f"({robot.x:.1f}, {robot.y:.1f})"
-        self.draw_text(pos_text, panel_x, y_pos, self.font_small)
-        y_pos += 40
-
-        # Heading
-        self.draw_text("Heading:", panel_x, y_pos, self.font_medium)
-        y_pos += 25
-        heading_text = f"{robot.heading:.1f}°"
-        self.draw_text(heading_text, panel_x, y_pos, self.font_small)
-        y_pos += 40
-
-        # Target Centric
-        self.draw_text("Target Centric:", panel_x, y_pos, self.font_medium)
-        y_pos += 30
-        self.draw_text(str(state.target_centric), panel_x, y_pos, self.font_small)
-        y_pos += 50
-
-        # Sonar
-        self.draw_text("Sonar:", panel_x, y_pos, self.font_medium)
-        y_pos += 30
-        self.draw_text(str(state.sonar_enabled), panel_x, y_pos, self.font_small)
-        y_pos += 50
-
-        # Tracking
-        self.draw_text("Tracking:", panel_x, y_pos, self.font_medium)
-        y_pos += 30
-        self.draw_text(str(state.tracking_enabled), panel_x, y_pos, self.font_small)
-        y_pos += 50
+        # One label per dynamic value; the value is drawn each frame below it
+        for label, label_gap, value_gap in _PANEL_FIELDS:
+            self.draw_text(label, text_x, y_pos, self.font_medium, surface=panel)
+            y_pos += label_gap
+            value_ys.append(y_pos)
+            y_pos += value_gap
 
         # Status
-        if state.target_reached:
-            self.draw_text("TARGET REACHED!", panel_x, y_pos, self.font_large, (0, 200, 0))
+        if target_reached:
+            self.draw_text(
+                "TARGET REACHED!", text_x, y_pos, self.font_large, (0, 200, 0), surface=panel
+            )
+
+        self._panel_static = panel
+        self._panel_value_ys = value_ys
+        return panel
 
     def draw_text(
         self,
@@ -232,10 +314,12 @@ class Renderer:
         y: int,
         font: pygame.font.Font,
         color: tuple = COLOR_UI_TEXT,
+        surface: Optional[pygame.Surface] = None,
     ) -> None:
-        """Draw text on the screen."""
-        text_surface = font.render(text, True, color)
-        self.screen.blit(text_surface, (x, y))
+        """Draw text on the screen (or on the given surface)."""
+        text_surface = self._text_cache.render(font, text, color)
+        target = surface if surface is not None else self.screen
+        target.blit(text_surface, (x, y))
 
     def draw_buttons(self) -> None:
         """Draw all UI buttons."""
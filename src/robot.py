@@ -2,12 +2,21 @@
 
 import math
 from typing import List, Tuple, Optional
-from src.config import ROBOT_RADIUS, ROBOT_STEP_SIZE, ROBOT_START_X, ROBOT_START_Y
+import numpy as np
+from src.config import (
+    ROBOT_RADIUS,
+    ROBOT_STEP_SIZE,
+    ROBOT_START_X,
+    ROBOT_START_Y,
+    PATH_TRACE_MAX,
+)
 from src.sonar import Sonar
 from src.environment import Environment
 from src.algorithms.base import NavigationAlgorithm
 from src.algorithms.reactive import ReactiveNavigationAlgorithm
 
+_PATH_INITIAL_CAPACITY = 1024
+
 
 class Robot:
     """Represents the navigating robot."""
@@ -18,9 +27,20 @@ class Robot:
         self.radius = ROBOT_RADIUS
         self.step_size = ROBOT_STEP_SIZE
         self.heading = 0.0  # Current heading in degrees
-        self.path_trace: List[Tuple[float, float]] = []
+        # Full path history as two growable float32 arrays (SoA)
+        self._path_x = np.empty(_PATH_INITIAL_CAPACITY, dtype=np.float32)
+        self._path_y = np.empty(_PATH_INITIAL_CAPACITY, dtype=np.float32)
+        self._path_len = 0
+        self._trace_points: List[Tuple[int, int]] = []  # Integer copy of path_trace
         self.sonar = Sonar()
 
+        # Recent positions for drawing, kept in a mirrored ring buffer: every
+        # point is written twice (at i and i + PATH_TRACE_MAX) so the latest
+        # window is always a contiguous slice, no copy needed.
+        self._trace = np.empty((2 * PATH_TRACE_MAX, 2), dtype=np.int32)
+        self._trace_head = 0
+        self._trace_len = 0
+
         # Set navigation algorithm (default to reactive)
         self.algorithm = algorithm if algorithm is not None else ReactiveNavigationAlgorithm()
 
@@ -32,7 +52,8 @@ class Robot:
             algorithm: Instance of a NavigationAlgorithm subclass
         """
         self.algorithm = algorithm
-        self.algorithm.reset()
+        if algorithm._has_reset:
+            algorithm.reset()
 
     def move(self, angle: float) -> None:
         """
@@ -42,8 +63,16 @@ class Robot:
             angle: Direction to move in degrees
         """
         rad = math.radians(angle)
-        self.x += self.step_size * math.cos(rad)
-        self.y += self.step_size * math.sin(rad)
+        self._move_to(
+            self.x + self.step_size * math.cos(rad),
+            self.y + self.step_size * math.sin(rad),
+            angle,
+        )
+
+    def _move_to(self, new_x: float, new_y: float, angle: float) -> None:
+        """Place the robot at an already computed position and heading."""
+        self.x = new_x
+        self.y = new_y
         self.heading = angle
 
     def manual_move(self, dx: float, dy: float) -> None:
@@ -84,31 +113,107 @@ class Robot:
             self.x, self.y, self.radius, self.heading, environment, sonar_obj
         )
 
-        # Check if the move would result in a collision
+        # Compute the destination once; it is both collision-checked and applied
         rad = math.radians(angle)
         new_x = self.x + self.step_size * math.cos(rad)
         new_y = self.y + self.step_size * math.sin(rad)
 
         # Only move if the destination is safe
         if not environment.check_collision(new_x, new_y, self.radius):
-            self.move(angle)
+            self._move_to(new_x, new_y, angle)
         else:
             # Notify algorithm of collision
-            self.algorithm.on_collision()
+            if self.algorithm._has_on_collision:
+                self.algorithm.on_collision()
+
+    @property
+    def path_trace(self) -> np.ndarray:
+        """Recorded path as an (N, 2) float32 array of (x, y) positions."""
+        n = self._path_len
+        return np.stack((self._path_x[:n], self._path_y[:n]), axis=1)
 
     def record_position(self) -> None:
         """Record current position for path tracing."""
-        self.path_trace.append((self.x, self.y))
+        n = self._path_len
+        if n == len(self._path_x):
+            # Geometric growth keeps appends amortized O(1)
+            self._path_x = np.resize(self._path_x, 2 * n)
+            self._path_y = np.resize(self._path_y, 2 * n)
+        self._path_x[n] = self.x
+        self._path_y[n] = self.y
+        self._path_len = n + 1
+        self._push_trace_point(self.x, self.y)
+
+    def _push_trace_point(self, x: float, y: float) -> None:
+        """Write a point into the recent-trace ring buffer."""
+        head = self._trace_head
+        point = (int(x), int(y))
+        self._trace[head] = point
+        self._trace[head + PATH_TRACE_MAX] = point
+        self._trace_head = (head + 1) % PATH_TRACE_MAX
+        if self._trace_len < PATH_TRACE_MAX:
+            self._trace_len += 1
+
+    def recent_trace(self) -> np.ndarray:
+        """
+        Get the most recent path points, oldest first.
+
+        Returns:
+            (N, 2) int32 view into the ring buffer, N <= PATH_TRACE_MAX
+        """
+        if self._trace_len < PATH_TRACE_MAX:
+            return self._trace[:self._trace_len]
+        head = self._trace_head
+        return self._trace[head:head + PATH_TRACE_MAX]
+
+    def trace_points(self) -> List[Tuple[int, int]]:
+        """
+        Get the full path trace as integer pixel coordinates.
+
+        The list is cached and only extended with points recorded since
+        the last call.
+        """
+        cached = len(self._trace_points)
+        n = self._path_len
+        if cached < n:
+            new_points = np.stack(
+                (self._path_x[cached:n], self._path_y[cached:n]), axis=1
+            ).astype(np.int32)
+            self._trace_points.extend(map(tuple, new_points.tolist()))
+        return self._trace_points
+
+    def clear_path(self) -> None:
+        """Clear the recorded path trace."""
+        self._path_len = 0
+        self._trace_points = []
+        self._trace_head = 0
+        self._trace_len = 0
 
     def save_path(self, filename: str) -> None:
-        """Save path trace to file."""
-        import numpy as np
-        np.save(filename, self.path_trace)
+        """Save path trace to an .npz file with separate x and y arrays."""
+        n = self._path_len
+        np.savez(filename, x=self._path_x[:n], y=self._path_y[:n])
 
     def load_path(self, filename: str) -> None:
-        """Load path trace from file."""
-        import numpy as np
+        """Load path trace from an .npz file (or a legacy (N, 2) .npy file)."""
         try:
-            self.path_trace = list(np.load(filename, allow_pickle=True))
+            data = np.load(filename, allow_pickle=False)
+            if isinstance(data, np.ndarray):
+                xs, ys = data[:, 0], data[:, 1]
+            else:
+                with data:
+                    xs, ys = data["x"], data["y"]
         except Exception as e:
             print(f"Warning: Could not load path from {filename}: {e}")
+            return
+
+        self.clear_path()
+        n = len(xs)
+        capacity = max(_PATH_INITIAL_CAPACITY, n)
+        self._path_x = np.empty(capacity, dtype=np.float32)
+        self._path_y = np.empty(capacity, dtype=np.float32)
+        self._path_x[:n] = xs
+        self._path_y[:n] = ys
+        self._path_len = n
+        for x, y in zip(xs[-PATH_TRACE_MAX:].tolist(), ys[-PATH_TRACE_MAX:].tolist()):
+            self._push_trace_point(x, y)
@@ -1,10 +1,13 @@
 """Sonar sensor for obstacle detection."""
 
 import math
-import random
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+import numpy as np
 from src.config import SONAR_RANGE, SONAR_ANGLES
 from src.environment import Environment
+from src.sonar_kernels import best_angle
+
+_RAND_BATCH = 1024  # Uniform draws generated per PRNG call
 
 
 class Sonar:
@@ -16,6 +19,26 @@ class Sonar:
         self.beams: List[Tuple[float, float, float, float]] = []  # (x1, y1, x2, y2) for each beam
         self.allowed_directions: List[int] = []
 
+        # Beam offsets from the robot, computed once for all sweeps
+        self._angles_np = np.asarray(self.angles, dtype=np.float64)
+        angles_rad = np.deg2rad(self._angles_np)
+        self._beam_dx = self.range * np.cos(angles_rad)
+        self._beam_dy = self.range * np.sin(angles_rad)
+
+        # Random picks are served from a batch of pre-generated uniforms
+        self._rng = np.random.default_rng()
+        self._rand_buf = self._rng.random(_RAND_BATCH).tolist()
+        self._rand_i = 0
+
+    def _pick(self, options: Sequence[int]) -> int:
+        """Pick a uniformly random element of options."""
+        if self._rand_i >= _RAND_BATCH:
+            self._rand_buf = self._rng.random(_RAND_BATCH).tolist()
+            self._rand_i = 0
+        u = self._rand_buf[self._rand_i]
+        self._rand_i += 1
+        return options[int(u * len(options))]
+
     def sweep(
         self,
         robot_x: float,
@@ -39,18 +62,21 @@ class Sonar:
         self.beams.clear()
         self.allowed_directions.clear()
 
-        # Cast beams in all directions
-        for angle in self.angles:
-            rad = math.radians(angle)
-            end_x = robot_x + self.range * math.cos(rad)
-            end_y = robot_y + self.range * math.sin(rad)
+        # Beam endpoints for all directions at once
+        end_xs = robot_x + self._beam_dx
+        end_ys = robot_y + self._beam_dy
 
-            # Store beam for visualization
-            self.beams.append((robot_x, robot_y, end_x, end_y))
+        # Cast all beams in one batch (accounting for robot radius)
+        allowed_mask = environment.paths_clear(
+            robot_x, robot_y, end_xs, end_ys, robot_radius
+        )
 
-            # Check if path is clear (accounting for robot radius)
-            if environment.is_path_clear(robot_x, robot_y, end_x, end_y, robot_radius):
-                self.allowed_directions.append(angle)
+        # Store beams for visualization
+        for end_x, end_y in zip(end_xs.tolist(), end_ys.tolist()):
+            self.beams.append((robot_x, robot_y, end_x, end_y))
+        self.allowed_directions.extend(
+            angle for angle, is_clear in zip(self.angles, allowed_mask.tolist()) if is_clear
+        )
 
         # If target-centric mode is enabled, try to move toward target
         if target_centric and self.allowed_directions:
@@ -65,29 +91,18 @@ class Sonar:
                 target_angle += 360
 
             # Find the closest safe direction to the target
-            min_diff = float('inf')
-            best_angle = None
-
-            for angle in self.allowed_directions:
-                # Calculate angular difference (accounting for wraparound)
-                diff = abs(angle - target_angle)
-                if diff > 180:
-                    diff = 360 - diff
-
-                if diff < min_diff:
-                    min_diff = diff
-                    best_angle = angle
+            best_index = best_angle(self._angles_np, allowed_mask, target_angle)
 
-            if best_angle is not None:
-                chosen_angle = best_angle
+            if best_index >= 0:
+                chosen_angle = self.angles[best_index]
             else:
-                chosen_angle = random.choice(self.allowed_directions)
+                chosen_angle = self._pick(self.allowed_directions)
         elif self.allowed_directions:
             # No target-centric mode, choose randomly from safe directions
-            chosen_angle = random.choice(self.allowed_directions)
+            chosen_angle = self._pick(self.allowed_directions)
         else:
             # If no safe directions, pick a random one anyway
-            chosen_angle = random.choice(self.angles)
+            chosen_angle = self._pick(self.angles)
 
         # Return the angle directly - no conversion needed
         # The sonar already uses standard math angles (0°=East, 90°=North)
@@ -0,0 +1,34 @@
+"""Numeric kernels used by the sonar sensor."""
+
+import numpy as np
+from src.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True, fastmath=True)
+def _best_angle_jit(angles: np.ndarray, allowed: np.ndarray, target_angle: float) -> int:
+    """Compiled scan over the beams; see best_angle."""
+    best = -1
+    min_diff = 361.0
+    for i in range(angles.shape[0]):
+        # Angular difference accounting for wraparound, without a branch
+        diff = abs(angles[i] - target_angle)
+        diff = min(diff, 360.0 - diff)
+        if allowed[i] and diff < min_diff:
+            min_diff = diff
+            best = i
+    return best
+
+
+def _best_angle_numpy(angles: np.ndarray, allowed: np.ndarray, target_angle: float) -> int:
+    """Vectorized reduction over the beams; see best_angle."""
+    diffs = np.abs(angles - target_angle)
+    np.minimum(diffs, 360.0 - diffs, out=diffs)
+    diffs[~allowed] = np.inf
+    best = int(np.argmin(diffs))
+    return best if allowed[best] else -1
+
+
+# Find the allowed beam whose angle is closest to the target angle. Takes
+# (angles in degrees, boolean allowed mask, target angle in 0-360) and returns
+# the beam index, or -1 if no beam is allowed; ties go to the lowest index.
+best_angle = _best_angle_jit if NUMBA_AVAILABLE else _best_angle_numpy
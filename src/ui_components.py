@@ -1,10 +1,71 @@
 """Modern UI components for the simulator."""
 
 import pygame
+from collections import OrderedDict
 from typing import List, Tuple, Optional, Callable
 from src.config import *
 
 
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color)."""
+
+    def __init__(self, max_size: int = 512) -> None:
+        self.max_size = max_size
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def render(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, ...]
+    ) -> pygame.Surface:
+        """Return the rendered surface for text, rendering it on a cache miss."""
+        key = (id(font), text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+
+class GlyphAtlas:
+    """Pre-rendered glyphs for drawing frequently changing numeric text."""
+
+    DEFAULT_CHARS = "0123456789.,()°- "
+
+    def __init__(
+        self, font: pygame.font.Font, color: Tuple[int, ...], chars: str = DEFAULT_CHARS
+    ) -> None:
+        self.font = font
+        self.color = color
+        self._glyphs = {ch: font.render(ch, True, color) for ch in chars}
+        self._widths = {ch: glyph.get_width() for ch, glyph in self._glyphs.items()}
+        self.height = font.get_height()
+
+    def supports(self, text: str) -> bool:
+        """Whether every character of text is in the atlas."""
+        glyphs = self._glyphs
+        return all(ch in glyphs for ch in text)
+
+    def width(self, text: str) -> int:
+        """Width in pixels of text laid out from the atlas."""
+        widths = self._widths
+        return sum(widths[ch] for ch in text)
+
+    def draw(self, surface: pygame.Surface, text: str, pos: Tuple[int, int]) -> None:
+        """Blit text with its top-left corner at pos, one glyph per character."""
+        x, y = pos
+        glyphs = self._glyphs
+        widths = self._widths
+        sequence = []
+        for ch in text:
+            sequence.append((glyphs[ch], (x, y)))
+            x += widths[ch]
+        surface.blits(sequence, doreturn=False)
+
+
 class ModernButton:
     """Modern styled button with hover and click effects."""
 
@@ -24,8 +85,25 @@ class ModernButton:
         self.is_pressed = False
         self.is_active = False
 
+        # Rendered button, redrawn only when its visual state changes
+        self._chrome: Optional[pygame.Surface] = None
+        self._chrome_state: Optional[tuple] = None
+
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw the modern button with gradient and effects."""
+        state = (self.is_active, self.is_pressed, self.is_hovered, id(font))
+        chrome = self._chrome
+        if chrome is None or state != self._chrome_state:
+            chrome = self._render_chrome(font)
+            self._chrome = chrome
+            self._chrome_state = state
+        screen.blit(chrome, self.rect)
+
+    def _render_chrome(self, font: pygame.font.Font) -> pygame.Surface:
+        """Render the button background, border and label for the current state."""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+
         # Determine color based on state
         if self.is_active:
             color = COLOR_ACCENT_PRIMARY
@@ -41,18 +119,19 @@ class ModernButton:
             text_color = COLOR_BUTTON_TEXT
 
         # Draw button background with rounded corners
-        pygame.draw.rect(screen, color, self.rect, border_radius=8)
+        pygame.draw.rect(surface, color, rect, border_radius=8)
 
         # Draw subtle border
         border_color = (
             COLOR_ACCENT_SECONDARY if self.is_active else (100, 100, 110)
         )
-        pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=8)
+        pygame.draw.rect(surface, border_color, rect, 2, border_radius=8)
 
         # Draw text
         text_surface = font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=rect.center)
+        surface.blit(text_surface, text_rect)
+        return surface
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events. Returns True if button was clicked."""
@@ -95,35 +174,45 @@ class Dropdown:
         self.list_rect = pygame.Rect(
             x, y + height, width, len(options) * self.item_height
         )
+        self._build_option_rects()
+
+        # Rendered closed-state button, redrawn only when its state changes
+        self._chrome: Optional[pygame.Surface] = None
+        self._chrome_state: Optional[tuple] = None
+
+    def _build_option_rects(self) -> None:
+        """Precompute the rect of each option in the dropdown list."""
+        self._option_rects = [
+            pygame.Rect(
+                self.list_rect.x,
+                self.list_rect.y + i * self.item_height,
+                self.list_rect.width,
+                self.item_height,
+            )
+            for i in range(len(self.options))
+        ]
+
+    def _option_at(self, pos: Tuple[int, int]) -> int:
+        """Return the index of the option under pos, or -1."""
+        if not self.list_rect.collidepoint(pos):
+            return -1
+        return min((pos[1] - self.list_rect.y) // self.item_height, len(self.options) - 1)
 
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw the dropdown menu."""
         # Draw main dropdown button
-        bg_color = COLOR_DROPDOWN_HOVER if self.is_hovered else COLOR_DROPDOWN_BG
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=8)
-        pygame.draw.rect(
-            screen, COLOR_DROPDOWN_BORDER, self.rect, 2, border_radius=8
-        )
-
-        # Draw selected text
-        selected_text = self.options[self.selected_index]
-        # Truncate long text
-        if len(selected_text) > 25:
-            selected_text = selected_text[:22] + "..."
-
-        text_surface = font.render(selected_text, True, COLOR_TEXT_PRIMARY)
-        text_rect = text_surface.get_rect(
-            midleft=(self.rect.x + 12, self.rect.centery)
-        )
-        screen.blit(text_surface, text_rect)
-
-        # Draw arrow indicator
-        arrow = "▼" if not self.is_open else "▲"
-        arrow_surface = font.render(arrow, True, COLOR_TEXT_SECONDARY)
-        arrow_rect = arrow_surface.get_rect(
-            midright=(self.rect.right - 12, self.rect.centery)
+        state = (
+            self.is_hovered,
+            self.is_open,
+            self.options[self.selected_index],
+            id(font),
         )
-        screen.blit(arrow_surface, arrow_rect)
+        chrome = self._chrome
+        if chrome is None or state != self._chrome_state:
+            chrome = self._render_chrome(font)
+            self._chrome = chrome
+            self._chrome_state = state
+        screen.blit(chrome, self.rect)
 
         # Draw dropdown list if open
         if self.is_open:
@@ -147,14 +236,7 @@ class Dropdown:
             )
 
             # Draw each option
-            for i, option in enumerate(self.options):
-                option_rect = pygame.Rect(
-                    self.list_rect.x,
-                    self.list_rect.y + i * self.item_height,
-                    self.list_rect.width,
-                    self.item_height,
-                )
-
+            for i, (option, option_rect) in enumerate(zip(self.options, self._option_rects)):
                 # Highlight hovered or selected option
                 if i == self.hovered_option:
                     pygame.draw.rect(
@@ -184,6 +266,34 @@ class Dropdown:
                 )
                 screen.blit(option_surface, option_text_rect)
 
+    def _render_chrome(self, font: pygame.font.Font) -> pygame.Surface:
+        """Render the closed dropdown button with its selected text and arrow."""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+
+        bg_color = COLOR_DROPDOWN_HOVER if self.is_hovered else COLOR_DROPDOWN_BG
+        pygame.draw.rect(surface, bg_color, rect, border_radius=8)
+        pygame.draw.rect(
+            surface, COLOR_DROPDOWN_BORDER, rect, 2, border_radius=8
+        )
+
+        # Draw selected text
+        selected_text = self.options[self.selected_index]
+        # Truncate long text
+        if len(selected_text) > 25:
+            selected_text = selected_text[:22] + "..."
+
+        text_surface = font.render(selected_text, True, COLOR_TEXT_PRIMARY)
+        text_rect = text_surface.get_rect(midleft=(12, rect.centery))
+        surface.blit(text_surface, text_rect)
+
+        # Draw arrow indicator
+        arrow = "▼" if not self.is_open else "▲"
+        arrow_surface = font.render(arrow, True, COLOR_TEXT_SECONDARY)
+        arrow_rect = arrow_surface.get_rect(midright=(rect.right - 12, rect.centery))
+        surface.blit(arrow_surface, arrow_rect)
+        return surface
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events. Returns True if selection changed."""
         if event.type == pygame.MOUSEMOTION:
@@ -191,17 +301,7 @@ class Dropdown:
 
             if self.is_open:
                 # Check which option is hovered
-                self.hovered_option = -1
-                for i in range(len(self.options)):
-                    option_rect = pygame.Rect(
-                        self.list_rect.x,
-                        self.list_rect.y + i * self.item_height,
-                        self.list_rect.width,
-                        self.item_height,
-                    )
-                    if option_rect.collidepoint(event.pos):
-                        self.hovered_option = i
-                        break
+                self.hovered_option = self._option_at(event.pos)
 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.is_hovered and not self.is_open:
@@ -210,6 +310,7 @@ class Dropdown:
                 return False
             elif self.is_open:
                 # Check if clicked on an option
+                self.hovered_option = self._option_at(event.pos)
                 if self.hovered_option >= 0:
                     old_index = self.selected_index
                     self.selected_index = self.hovered_option
@@ -228,6 +329,7 @@ class Dropdown:
         self.options = options
         self.selected_index = selected_index
         self.list_rect.height = len(options) * self.item_height
+        self._build_option_rects()
 
 
 class ToggleSwitch:
@@ -239,29 +341,47 @@ class ToggleSwitch:
         self.is_on = False
         self.is_hovered = False
 
+        # Rendered label and switch, redrawn only when toggled
+        self._chrome: Optional[pygame.Surface] = None
+        self._chrome_state: Optional[tuple] = None
+
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw the toggle switch."""
+        state = (self.is_on, id(font))
+        chrome = self._chrome
+        if chrome is None or state != self._chrome_state:
+            chrome = self._render_chrome(font)
+            self._chrome = chrome
+            self._chrome_state = state
+        screen.blit(chrome, self.rect)
+
+    def _render_chrome(self, font: pygame.font.Font) -> pygame.Surface:
+        """Render the label, track and knob for the current state."""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+
         # Draw label
         label_surface = font.render(self.label, True, COLOR_TEXT_SECONDARY)
-        label_rect = label_surface.get_rect(midleft=(self.rect.x, self.rect.centery))
-        screen.blit(label_surface, label_rect)
+        label_rect = label_surface.get_rect(midleft=(0, rect.centery))
+        surface.blit(label_surface, label_rect)
 
         # Switch dimensions
         switch_width = 50
         switch_height = 26
-        switch_x = self.rect.right - switch_width
-        switch_y = self.rect.centery - switch_height // 2
+        switch_x = rect.right - switch_width
+        switch_y = rect.centery - switch_height // 2
         switch_rect = pygame.Rect(switch_x, switch_y, switch_width, switch_height)
 
         # Draw switch background
         bg_color = COLOR_SUCCESS if self.is_on else COLOR_BG_LIGHT
-        pygame.draw.rect(screen, bg_color, switch_rect, border_radius=13)
+        pygame.draw.rect(surface, bg_color, switch_rect, border_radius=13)
 
         # Draw switch knob
         knob_radius = 10
         knob_x = switch_x + switch_width - 13 if self.is_on else switch_x + 13
         knob_y = switch_y + switch_height // 2
-        pygame.draw.circle(screen, COLOR_WHITE, (knob_x, knob_y), knob_radius)
+        pygame.draw.circle(surface, COLOR_WHITE, (knob_x, knob_y), knob_radius)
+        return surface
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events. Returns True if toggled."""
@@ -284,29 +404,58 @@ class StatCard:
         self.label = label
         self.value = value
 
+        # Rendered background and label; only the value changes per frame
+        self._chrome: Optional[pygame.Surface] = None
+        self._chrome_state: Optional[tuple] = None
+        self._value_glyphs: Optional[GlyphAtlas] = None
+
     def draw(
         self, screen: pygame.Surface, label_font: pygame.font.Font, value_font: pygame.font.Font
     ) -> None:
         """Draw the stat card."""
+        state = (self.label, id(label_font))
+        chrome = self._chrome
+        if chrome is None or state != self._chrome_state:
+            chrome = self._render_chrome(label_font)
+            self._chrome = chrome
+            self._chrome_state = state
+        screen.blit(chrome, self.rect)
+
+        # Draw value, from pre-rendered glyphs when it is purely numeric
+        value = str(self.value)
+        glyphs = self._value_glyphs
+        if glyphs is None or glyphs.font is not value_font:
+            glyphs = self._value_glyphs = GlyphAtlas(value_font, COLOR_TEXT_PRIMARY)
+        if glyphs.supports(value):
+            width = glyphs.width(value)
+            glyphs.draw(
+                screen,
+                value,
+                (self.rect.centerx - width // 2, self.rect.bottom - 8 - glyphs.height),
+            )
+        else:
+            value_surface = value_font.render(value, True, COLOR_TEXT_PRIMARY)
+            value_rect = value_surface.get_rect(
+                midbottom=(self.rect.centerx, self.rect.bottom - 8)
+            )
+            screen.blit(value_surface, value_rect)
+
+    def _render_chrome(self, label_font: pygame.font.Font) -> pygame.Surface:
+        """Render the card background and label."""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+
         # Draw card background
-        pygame.draw.rect(screen, COLOR_UI_PANEL, self.rect, border_radius=8)
+        pygame.draw.rect(surface, COLOR_UI_PANEL, rect, border_radius=8)
         pygame.draw.rect(
-            screen, COLOR_BG_LIGHT, self.rect, 1, border_radius=8
+            surface, COLOR_BG_LIGHT, rect, 1, border_radius=8
         )
 
         # Draw label
         label_surface = label_font.render(self.label, True, COLOR_TEXT_SECONDARY)
-        label_rect = label_surface.get_rect(
-            midtop=(self.rect.centerx, self.rect.y + 8)
-        )
-        screen.blit(label_surface, label_rect)
-
-        # Draw value
-        value_surface = value_font.render(str(self.value), True, COLOR_TEXT_PRIMARY)
-        value_rect = value_surface.get_rect(
-            midbottom=(self.rect.centerx, self.rect.bottom - 8)
-        )
-        screen.blit(value_surface, value_rect)
+        label_rect = label_surface.get_rect(midtop=(rect.centerx, 8))
+        surface.blit(label_surface, label_rect)
+        return surface
 
     def update_value(self, value: str) -> None:
         """Update the displayed value."""
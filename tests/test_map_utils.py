@@ -0,0 +1,20 @@
+"""Tests for the grid search helpers in tools/_map_utils.py."""
+
+import numpy as np
+
+from tools._map_utils import _MOVES, _bfs_tree, _subtree_bounds
+
+
+def test_subtree_bounds_with_several_seeds() -> None:
+    # One free row with seeds at cells 0 and 2: the BFS gives cell 0 the
+    # subtree {0, 1} and cell 2 the subtree {2, 3, 4}
+    grid = np.zeros((1, 5), dtype=np.bool_)
+    seeds = np.array([0, 2], dtype=np.int32)
+    _, parent, order = _bfs_tree(grid, seeds, _MOVES)
+
+    bounds = _subtree_bounds(parent, order, grid.shape[1])
+
+    assert bounds[0].tolist() == [0, 0, 1, 0]
+    assert bounds[2].tolist() == [2, 0, 4, 0]
+    # The last cell is a leaf; seed subtrees must not leak into it
+    assert bounds[4].tolist() == [4, 0, 4, 0]
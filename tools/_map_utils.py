@@ -0,0 +1,511 @@
+"""Helpers shared by the map generation scripts."""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.collision_kernels import points_in_polygons
+from src.config import (
+    CANVAS_HEIGHT,
+    CANVAS_WIDTH,
+    OBSTACLE_CIRCLE_RADIUS,
+    ROBOT_RADIUS,
+    TARGET_RADIUS,
+)
+from src.jit import njit
+from src.map_io import OBSTACLE_CIRCLE, ObstacleSoA, save_array
+
+# Bump when the files written for a map change, so existing maps are rebuilt
+MAP_FORMAT_VERSION = 7
+
+SPEC_HASH_FILE = ".spec_hash"
+
+
+def spec_hash(*spec: object) -> str:
+    """Short digest of a map spec (start, target, obstacles, ...)."""
+    data = repr((MAP_FORMAT_VERSION,) + spec).encode()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def is_up_to_date(map_folder: Path, digest: str) -> bool:
+    """Whether map_folder was last built from a spec with this digest."""
+    try:
+        return (Path(map_folder) / SPEC_HASH_FILE).read_text() == digest
+    except OSError:
+        return False
+
+
+def needs_rebuild(map_folder: Path, digest: str, outputs: Iterable[str]) -> bool:
+    """
+    Whether map_folder must be (re)built from a spec with this digest.
+
+    True if the folder was built from a different spec, or if any of the
+    expected output files has since been deleted. The folder is listed once
+    with os.scandir instead of stat-ing each file.
+    """
+    try:
+        with os.scandir(map_folder) as entries:
+            present = {entry.name for entry in entries}
+    except OSError:
+        return True
+    if SPEC_HASH_FILE not in present or not present.issuperset(outputs):
+        return True
+    return not is_up_to_date(map_folder, digest)
+
+
+def mark_built(map_folder: Path, digest: str) -> None:
+    """Record the spec digest a map folder was built from."""
+    (Path(map_folder) / SPEC_HASH_FILE).write_text(digest)
+
+
+def dedupe_obstacles(obstacles: Sequence[Sequence[float]]) -> Tuple[List[Sequence[float]], int]:
+    """
+    Drop exact duplicate obstacles, keeping the first of each.
+
+    Returns:
+        (unique obstacles in their original order, number removed)
+    """
+    seen = set()
+    unique = []
+    for obs in obstacles:
+        key = tuple(map(tuple, np.asarray(obs).reshape(-1, 2).tolist()))
+        if key not in seen:
+            seen.add(key)
+            unique.append(obs)
+    return unique, len(obstacles) - len(unique)
+
+
+@njit(cache=True)
+def rects_to_polys(rects: np.ndarray) -> np.ndarray:
+    """
+    Convert axis-aligned rectangles to flat 4-vertex polygons.
+
+    Args:
+        rects: (N, 4) array of [x1, y1, x2, y2] corners
+
+    Returns:
+        (N, 8) float32 array of [x1, y1, x1, y2, x2, y2, x2, y1]
+    """
+    n = rects.shape[0]
+    out = np.empty((n, 8), dtype=np.float32)
+    for i in range(n):
+        x1 = rects[i, 0]
+        y1 = rects[i, 1]
+        x2 = rects[i, 2]
+        y2 = rects[i, 3]
+        out[i, 0] = x1
+        out[i, 1] = y1
+        out[i, 2] = x1
+        out[i, 3] = y2
+        out[i, 4] = x2
+        out[i, 5] = y2
+        out[i, 6] = x2
+        out[i, 7] = y1
+    return out
+
+
+GRID_CELL = 5  # Collision grid resolution in pixels
+GRID_FILES = ("grid.npy", "grid_packed.npy", "grid.json")
+
+
+def points_blocked(xs: np.ndarray, ys: np.ndarray, obstacles: ObstacleSoA) -> np.ndarray:
+    """Whether each point lies inside an obstacle (no margin, no walls)."""
+    blocked = np.zeros(xs.shape[0], dtype=bool)
+    if len(obstacles) == 0:
+        return blocked
+
+    verts = obstacles.verts.astype(np.float64)
+    circles = obstacles.kind == OBSTACLE_CIRCLE
+    inside = points_in_polygons(xs, ys, verts, obstacles.offsets.astype(np.int64))
+    blocked |= inside[:, ~circles].any(axis=1)
+
+    centers = verts[obstacles.offsets[:-1][circles]]
+    if len(centers):
+        dist = np.sqrt((xs[:, None] - centers[:, 0]) ** 2 + (ys[:, None] - centers[:, 1]) ** 2)
+        blocked |= (dist <= OBSTACLE_CIRCLE_RADIUS).any(axis=1)
+    return blocked
+
+
+def rasterize(
+    obstacles: ObstacleSoA, width: int = 700, height: int = 700, cell: int = GRID_CELL
+) -> np.ndarray:
+    """
+    Rasterize obstacles into an occupancy grid.
+
+    A cell is occupied when its center lies inside an obstacle, so the grid
+    matches what Environment.check_collision reports at cell centers (without
+    the boundary walls).
+
+    Returns:
+        (height // cell, width // cell) bool array indexed [row, col] = [y, x]
+    """
+    rows, cols = height // cell, width // cell
+    ys, xs = np.mgrid[0:rows, 0:cols]
+    xs = (xs.ravel() + 0.5) * cell
+    ys = (ys.ravel() + 0.5) * cell
+
+    occupied = points_blocked(xs, ys, obstacles)
+    return occupied.reshape(rows, cols)
+
+
+def save_grid(map_folder: Path, grid: np.ndarray, cell: int = GRID_CELL) -> None:
+    """Write the occupancy grid, a bit-packed copy and its JSON metadata."""
+    map_folder = Path(map_folder)
+    save_array(map_folder / "grid.npy", grid)
+    save_array(map_folder / "grid_packed.npy", np.packbits(grid))
+    meta = {"cell": cell, "rows": grid.shape[0], "cols": grid.shape[1]}
+    (map_folder / "grid.json").write_text(json.dumps(meta))
+
+
+def load_grid(map_folder: Path) -> Tuple[np.ndarray, int]:
+    """Read a map's occupancy grid from its packed form; returns (grid, cell)."""
+    map_folder = Path(map_folder)
+    meta = json.loads((map_folder / "grid.json").read_text())
+    packed = np.load(map_folder / "grid_packed.npy", allow_pickle=False)
+    count = meta["rows"] * meta["cols"]
+    grid = np.unpackbits(packed, count=count).astype(bool)
+    return grid.reshape(meta["rows"], meta["cols"]), meta["cell"]
+
+
+NAVGRAPH_FILE = "navgraph.npz"
+CIRCLE_NODE_STEP = 30  # Degrees between navigation nodes around a circle
+_LOS_CHUNK = 4096  # Node pairs tested per vectorized batch
+
+
+def _convex_hull(points: np.ndarray) -> np.ndarray:
+    """Convex hull of (N, 2) points in counter-clockwise order (monotone chain)."""
+    pts = sorted(set(map(tuple, points.tolist())))
+    if len(pts) <= 2:
+        return np.array(pts, dtype=np.float64)
+
+    def half(seq: Iterable[Tuple[float, ...]]) -> List[Tuple[float, ...]]:
+        hull: List[Tuple[float, ...]] = []
+        for p in seq:
+            while (
+                len(hull) >= 2
+                and (
+                    (hull[-1][0] - hull[-2][0]) * (p[1] - hull[-2][1])
+                    - (hull[-1][1] - hull[-2][1]) * (p[0] - hull[-2][0])
+                )
+                <= 0
+            ):
+                hull.pop()
+            hull.append(p)
+        return hull[:-1]
+
+    return np.array(half(pts) + half(reversed(pts)), dtype=np.float64)
+
+
+def navgraph_nodes(obstacles: ObstacleSoA, clearance: float = ROBOT_RADIUS) -> np.ndarray:
+    """
+    Candidate waypoints around the obstacles, as (N, 2) float64.
+
+    Polygon convex-hull vertices are pushed `clearance` away from the hull
+    center and circles are sampled every CIRCLE_NODE_STEP degrees at
+    `clearance` outside their radius. Points off the canvas or inside another
+    obstacle are dropped.
+    """
+    parts = []
+    verts = obstacles.verts.astype(np.float64)
+    offsets = obstacles.offsets.tolist()
+    angles = np.radians(np.arange(0, 360, CIRCLE_NODE_STEP))
+    ring = np.stack((np.cos(angles), np.sin(angles)), axis=1)
+
+    for kind, start, end in zip(obstacles.kind.tolist(), offsets[:-1], offsets[1:]):
+        if kind == OBSTACLE_CIRCLE:
+            parts.append(verts[start] + ring * (OBSTACLE_CIRCLE_RADIUS + clearance))
+        else:
+            hull = _convex_hull(verts[start:end])
+            away = hull - hull.mean(axis=0)
+            norm = np.linalg.norm(away, axis=1, keepdims=True)
+            parts.append(hull + away / np.maximum(norm, 1e-9) * clearance)
+
+    if not parts:
+        return np.empty((0, 2), dtype=np.float64)
+    nodes: np.ndarray = np.concatenate(parts)
+
+    x, y = nodes[:, 0], nodes[:, 1]
+    on_canvas = (
+        (x >= clearance)
+        & (x <= CANVAS_WIDTH - clearance)
+        & (y >= clearance)
+        & (y <= CANVAS_HEIGHT - clearance)
+    )
+    nodes = nodes[on_canvas]
+    free: np.ndarray = nodes[~points_blocked(nodes[:, 0], nodes[:, 1], obstacles)]
+    return free
+
+
+def _segments_clear(a: np.ndarray, b: np.ndarray, obstacles: ObstacleSoA) -> np.ndarray:
+    """Whether each segment a[i] -> b[i] avoids every obstacle (endpoints outside)."""
+    clear = np.ones(a.shape[0], dtype=bool)
+    verts = obstacles.verts.astype(np.float64)
+    circles = obstacles.kind == OBSTACLE_CIRCLE
+    offsets = obstacles.offsets
+
+    # Circles: distance from each center to the segment
+    centers = verts[offsets[:-1][circles]]
+    if len(centers):
+        d = b - a
+        length_sq = np.maximum((d**2).sum(axis=1), 1e-12)
+        rel_x = centers[None, :, 0] - a[:, None, 0]
+        rel_y = centers[None, :, 1] - a[:, None, 1]
+        t = np.clip((rel_x * d[:, None, 0] + rel_y * d[:, None, 1]) / length_sq[:, None], 0.0, 1.0)
+        gap_x = rel_x - t * d[:, None, 0]
+        gap_y = rel_y - t * d[:, None, 1]
+        clear &= ~(gap_x**2 + gap_y**2 < OBSTACLE_CIRCLE_RADIUS**2).any(axis=1)
+
+    # Polygons: proper crossings with any edge
+    poly_ids = np.flatnonzero(~circles)
+    if len(poly_ids):
+        starts, ends = offsets[poly_ids], offsets[poly_ids + 1]
+        edge_a = np.concatenate([verts[s:e] for s, e in zip(starts, ends)])
+        edge_b = np.concatenate([np.roll(verts[s:e], -1, axis=0) for s, e in zip(starts, ends)])
+
+        def orient(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+            turn: np.ndarray = (q[..., 0] - p[..., 0]) * (r[..., 1] - p[..., 1]) - (
+                q[..., 1] - p[..., 1]
+            ) * (r[..., 0] - p[..., 0])
+            return turn
+
+        sa, sb = a[:, None, :], b[:, None, :]
+        ea, eb = edge_a[None, :, :], edge_b[None, :, :]
+        crosses = (orient(sa, sb, ea) * orient(sa, sb, eb) < 0) & (
+            orient(ea, eb, sa) * orient(ea, eb, sb) < 0
+        )
+        clear &= ~crosses.any(axis=1)
+
+        # A segment can also enter a polygon through its vertices without
+        # crossing an edge properly (e.g. a rectangle's diagonal). Split such
+        # segments at the vertices they touch and test each piece's midpoint.
+        d = b - a
+        rel = edge_a[None, :, :] - sa
+        t = (rel[..., 0] * d[:, None, 0] + rel[..., 1] * d[:, None, 1]) / np.maximum(
+            (d**2).sum(axis=1), 1e-12
+        )[:, None]
+        touches = (np.abs(orient(sa, sb, ea)) < 1e-6) & (t > 0) & (t < 1)
+        all_verts = offsets.astype(np.int64)
+        for i in np.flatnonzero(clear & touches.any(axis=1)):
+            cuts = np.concatenate(([0.0], np.sort(t[i, touches[i]]), [1.0]))
+            mids = (cuts[:-1] + cuts[1:]) / 2
+            pts = a[i] + mids[:, None] * d[i]
+            inside = points_in_polygons(pts[:, 0], pts[:, 1], verts, all_verts)[:, poly_ids]
+            clear[i] = not inside.any()
+
+    return clear
+
+
+def build_navgraph(
+    obstacles: ObstacleSoA, clearance: float = ROBOT_RADIUS
+) -> Dict[str, np.ndarray]:
+    """
+    Visibility graph between the waypoints of navgraph_nodes.
+
+    Two nodes are connected when the straight segment between them crosses no
+    obstacle. Edges are stored both ways in CSR form: the neighbours of node i
+    are indices[indptr[i]:indptr[i + 1]], at Euclidean distances weights[...].
+
+    Returns:
+        dict of nodes (N, 2) float32, indptr (N + 1,) int32, indices (E,) int32
+        and weights (E,) float32, ready for np.savez
+    """
+    nodes = navgraph_nodes(obstacles, clearance)
+    n = len(nodes)
+    rows, cols = np.triu_indices(n, k=1)
+
+    keep = np.zeros(rows.shape[0], dtype=bool)
+    for lo in range(0, rows.shape[0], _LOS_CHUNK):
+        hi = lo + _LOS_CHUNK
+        keep[lo:hi] = _segments_clear(nodes[rows[lo:hi]], nodes[cols[lo:hi]], obstacles)
+    rows, cols = rows[keep], cols[keep]
+
+    # Both directions, sorted by source node
+    src = np.concatenate((rows, cols))
+    dst = np.concatenate((cols, rows))
+    order = np.lexsort((dst, src))
+    src, dst = src[order], dst[order]
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    weights = np.linalg.norm(nodes[src] - nodes[dst], axis=1)
+
+    return {
+        "nodes": nodes.astype(np.float32),
+        "indptr": indptr,
+        "indices": dst.astype(np.int32),
+        "weights": weights.astype(np.float32),
+    }
+
+
+def save_navgraph(map_folder: Path, graph: Dict[str, np.ndarray]) -> None:
+    """Write a graph from build_navgraph to the map's navgraph.npz."""
+    # numpy's stub checks **kwds against its allow_pickle parameter
+    np.savez(Path(map_folder) / NAVGRAPH_FILE, **graph)  # type: ignore[arg-type]
+
+
+JPSPLUS_FILE = "jpsplus.npz"
+GOAL_DISTANCE_FILE = "h_to_goal.npy"
+
+# 8-connected grid moves; diagonals may not cut obstacle corners
+_MOVES = np.array(
+    [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)], dtype=np.int64
+)
+
+
+def jump_points(grid: np.ndarray) -> np.ndarray:
+    """
+    Free cells next to a convex obstacle corner, as (K, 2) [row, col].
+
+    These are the JPS+ jump points: a cell whose diagonal neighbour is blocked
+    while both cells beside that diagonal are free. Outside the grid counts
+    as blocked.
+    """
+    blocked = np.pad(grid, 1, constant_values=True)
+    free = ~blocked
+    rows, cols = grid.shape
+    center = free[1 : rows + 1, 1 : cols + 1]
+
+    is_jump = np.zeros_like(center)
+    for dr, dc in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+        diag = blocked[1 + dr : rows + 1 + dr, 1 + dc : cols + 1 + dc]
+        side_r = free[1 + dr : rows + 1 + dr, 1 : cols + 1]
+        side_c = free[1 : rows + 1, 1 + dc : cols + 1 + dc]
+        is_jump |= diag & side_r & side_c
+    return np.argwhere(center & is_jump)
+
+
+@njit(cache=True)
+def _bfs_tree(
+    grid: np.ndarray, seeds: np.ndarray, moves: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Breadth-first search from the seed cells over free cells (FIFO queue).
+
+    Returns (dist, parent, order): steps to the nearest seed per cell (-1 if
+    unreachable), each cell's next cell towards the seeds (flat index, -1 for
+    seeds), and the flat indices of reached cells in visiting order.
+    """
+    rows, cols = grid.shape
+    dist = np.full((rows, cols), -1, dtype=np.int32)
+    parent = np.full(rows * cols, -1, dtype=np.int32)
+    order = np.empty(rows * cols, dtype=np.int32)
+
+    tail = 0
+    for s in range(seeds.shape[0]):
+        seed = seeds[s]
+        dist[seed // cols, seed % cols] = 0
+        order[tail] = seed
+        tail += 1
+
+    head = 0
+    while head < tail:
+        cur = order[head]
+        head += 1
+        r = cur // cols
+        c = cur % cols
+        for m in range(moves.shape[0]):
+            dr = moves[m, 0]
+            dc = moves[m, 1]
+            nr = r + dr
+            nc = c + dc
+            if nr < 0 or nr >= rows or nc < 0 or nc >= cols:
+                continue
+            if grid[nr, nc] or dist[nr, nc] >= 0:
+                continue
+            if dr != 0 and dc != 0 and (grid[r + dr, c] or grid[r, c + dc]):
+                continue
+            dist[nr, nc] = dist[r, c] + 1
+            parent[nr * cols + nc] = cur
+            order[tail] = nr * cols + nc
+            tail += 1
+    return dist, parent, order[:tail]
+
+
+def goal_cells(grid: np.ndarray, target: Sequence[float], cell: int = GRID_CELL) -> np.ndarray:
+    """
+    Flat indices of the free cells whose centers are within TARGET_RADIUS of
+    the target, i.e. where the robot counts as having reached it.
+    """
+    rows, cols = grid.shape
+    ys, xs = np.mgrid[0:rows, 0:cols]
+    dist = np.hypot((xs + 0.5) * cell - target[0], (ys + 0.5) * cell - target[1])
+    return np.flatnonzero((dist <= TARGET_RADIUS) & ~grid).astype(np.int32)
+
+
+@njit(cache=True)
+def _subtree_bounds(parent: np.ndarray, order: np.ndarray, cols: int) -> np.ndarray:
+    """[xmin, ymin, xmax, ymax] of every reached cell's BFS subtree, in cells."""
+    bounds = np.full((parent.shape[0], 4), -1, dtype=np.int32)
+    for k in range(order.shape[0]):
+        cell = order[k]
+        bounds[cell, 0] = bounds[cell, 2] = cell % cols
+        bounds[cell, 1] = bounds[cell, 3] = cell // cols
+    # Children are visited after their parent, so walk the order backwards
+    for k in range(order.shape[0] - 1, -1, -1):
+        cell = order[k]
+        p = parent[cell]
+        if p < 0:
+            continue  # A seed: the root of its own subtree
+        bounds[p, 0] = min(bounds[p, 0], bounds[cell, 0])
+        bounds[p, 1] = min(bounds[p, 1], bounds[cell, 1])
+        bounds[p, 2] = max(bounds[p, 2], bounds[cell, 2])
+        bounds[p, 3] = max(bounds[p, 3], bounds[cell, 3])
+    return bounds
+
+
+def goal_distance(grid: np.ndarray, target: Sequence[float], cell: int = GRID_CELL) -> np.ndarray:
+    """
+    Shortest-path distance from every grid cell to the target, in pixels.
+
+    A BFS from the goal cells (see goal_cells) counts 8-connected steps; a
+    step is `cell` pixels and a real move between the same cells is at least
+    that long, so the field never overestimates and is an admissible A*
+    heuristic. Blocked and unreachable cells are inf.
+
+    Returns:
+        float32 array shaped like grid
+    """
+    dist, _, _ = _bfs_tree(grid, goal_cells(grid, target, cell), _MOVES)
+    field: np.ndarray = dist.astype(np.float32) * cell
+    field[dist < 0] = np.inf
+    return field
+
+
+def compute_jpsplus(
+    grid: np.ndarray, target: Sequence[float], cell: int = GRID_CELL
+) -> Dict[str, np.ndarray]:
+    """
+    Jump points of an occupancy grid with goal bounds for the map's target.
+
+    One BFS from the goal cells (see goal_cells) builds a shortest-path
+    tree. The bounds of a jump point enclose every cell whose tree path to the
+    target runs through it, so a search from a start outside those bounds can
+    skip that jump point. Unreachable jump points get bounds of -1.
+
+    Returns:
+        dict of jp_xy (K, 2) int16 [col, row], bounds (K, 4) int16
+        [xmin, ymin, xmax, ymax] and goal (2,) int16 [col, row] of the target,
+        all in grid cells, ready for np.savez
+    """
+    cols = grid.shape[1]
+    _, parent, order = _bfs_tree(grid, goal_cells(grid, target, cell), _MOVES)
+    subtree = _subtree_bounds(parent, order, cols)
+
+    jps = jump_points(grid)
+    return {
+        "jp_xy": jps[:, ::-1].astype(np.int16),
+        "bounds": subtree[jps[:, 0] * cols + jps[:, 1]].astype(np.int16),
+        "goal": (np.asarray(target[:2]) // cell).astype(np.int16),
+    }
+
+
+def save_jpsplus(map_folder: Path, table: Dict[str, np.ndarray]) -> None:
+    """Write a table from compute_jpsplus to the map's jpsplus.npz."""
+    # numpy's stub checks **kwds against its allow_pickle parameter
+    np.savez(Path(map_folder) / JPSPLUS_FILE, **table)  # type: ignore[arg-type]
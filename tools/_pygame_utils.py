@@ -0,0 +1,49 @@
+"""
+Window setup and cached drawing shared by the map editor and preview_map.
+
+Surfaces made here are converted to the display's pixel format, so
+init_window must be called before the other helpers.
+"""
+
+import functools
+from typing import List
+
+import pygame
+
+from src.config import COLOR_CANVAS_BG
+
+GRID_SPACING = 50
+GRID_COLOR = (220, 220, 225)
+
+
+def init_window(width: int, height: int, caption: str) -> pygame.Surface:
+    """Initialize pygame and open the tool's window."""
+    # Fonts cached before a pygame.quit() are no longer usable
+    if not pygame.font.get_init():
+        get_font.cache_clear()
+    pygame.init()
+    screen = pygame.display.set_mode((width, height))
+    pygame.display.set_caption(caption)
+    return screen
+
+
+@functools.lru_cache(maxsize=8)
+def get_font(size: int) -> pygame.font.Font:
+    """The default font at size, loaded once per process."""
+    return pygame.font.Font(None, size)
+
+
+def load_fonts(*sizes: int) -> List[pygame.font.Font]:
+    """The default font at each of the given sizes."""
+    return [get_font(size) for size in sizes]
+
+
+def grid_surface(width: int, height: int) -> pygame.Surface:
+    """Canvas background with the grid lines, drawn once for blitting."""
+    surf = pygame.Surface((width, height)).convert()
+    surf.fill(COLOR_CANVAS_BG)
+    for x in range(0, width, GRID_SPACING):
+        pygame.draw.line(surf, GRID_COLOR, (x, 0), (x, height), 1)
+    for y in range(0, height, GRID_SPACING):
+        pygame.draw.line(surf, GRID_COLOR, (0, y), (width, y), 1)
+    return surf
@@ -5,21 +5,28 @@ Template script for creating maps programmatically.
 Edit this file to create your custom map, then run:
     python tools/create_map.py
 
-Your map will be saved to maps/ directory.
+Your map will be saved to maps/ directory. Maps kept in the repository are
+defined as JSON specs in tools/map_specs/ and built with tools/maps.py.
 """
 
-import numpy as np
+import sys
 from pathlib import Path
+from typing import Sequence, Tuple
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def create_custom_map():
+from tools import maps
+
+
+def create_custom_map() -> Tuple[str, Sequence[Sequence[float]], Sequence[Sequence[float]]]:
     """Create a custom map. Modify this function to create your map!"""
 
     # ========================================
     # EDIT THIS SECTION
     # ========================================
 
-    # Map name (files will be saved as: {name}_target.npy and {name}_obstacles.npy)
+    # Map name (files will be saved in maps/{name}/)
     map_name = "my_custom_map"
 
     # Define target position [x, y]
@@ -50,82 +57,32 @@ def create_custom_map():
     return map_name, target, obstacles
 
 
-def save_map(map_name, target, obstacles):
+def save_map(
+    map_name: str, target: Sequence[Sequence[float]], obstacles: Sequence[Sequence[float]]
+) -> None:
     """Save map to files."""
-    # Create maps directory
-    maps_dir = Path("maps")
-    maps_dir.mkdir(exist_ok=True)
-
-    # Convert to numpy arrays
-    target_data = np.array(target)
-    obstacles_data = np.array(obstacles, dtype=object)
-
-    # Save files
-    target_file = maps_dir / f"{map_name}_target.npy"
-    obstacles_file = maps_dir / f"{map_name}_obstacles.npy"
-
-    np.save(target_file, target_data)
-    np.save(obstacles_file, obstacles_data, allow_pickle=True)
+    map_folder = maps.MAPS_DIR / map_name
+    if not maps.save_map(map_name, None, target[0], obstacles):
+        print(f"✓ {map_name} is up to date; nothing was written to {map_folder}/")
+        return
 
     # Print summary
-    print("=" * 60)
-    print("Map Created Successfully!")
-    print("=" * 60)
-    print(f"Map name: {map_name}")
-    print(f"Target: {target[0]}")
-    print(f"Obstacles: {len(obstacles)}")
-    print(f"\nFiles saved:")
-    print(f"  {target_file}")
-    print(f"  {obstacles_file}")
-    print("\nTo use this map in the simulator:")
-    print("1. Edit src/main.py")
-    print("2. In _load_default_map(), change the file paths to:")
-    print(f"   target_file = maps_path / '{map_name}_target.npy'")
-    print(f"   obstacles_file = maps_path / '{map_name}_obstacles.npy'")
-    print("3. Run: python -m src.main")
-    print("=" * 60)
-
-
-def validate_map(target, obstacles):
-    """Validate the map data."""
-    errors = []
-
-    # Check target
-    if not target or len(target) == 0:
-        errors.append("No target defined")
-    elif len(target[0]) != 2:
-        errors.append("Target must be [x, y]")
-    else:
-        x, y = target[0]
-        if not (0 <= x <= 700):
-            errors.append(f"Target x={x} out of bounds (0-700)")
-        if not (0 <= y <= 700):
-            errors.append(f"Target y={y} out of bounds (0-700)")
-
-    # Check obstacles
-    for i, obs in enumerate(obstacles):
-        if len(obs) == 2:  # Circle
-            x, y = obs
-            if not (0 <= x <= 700):
-                errors.append(f"Obstacle {i} (circle) x={x} out of bounds")
-            if not (0 <= y <= 700):
-                errors.append(f"Obstacle {i} (circle) y={y} out of bounds")
-        elif len(obs) >= 4:  # Polygon
-            if len(obs) % 2 != 0:
-                errors.append(f"Obstacle {i} (polygon) has odd number of coordinates")
-            for j in range(0, len(obs), 2):
-                x, y = obs[j], obs[j+1]
-                if not (0 <= x <= 700):
-                    errors.append(f"Obstacle {i} (polygon) point {j//2} x={x} out of bounds")
-                if not (0 <= y <= 700):
-                    errors.append(f"Obstacle {i} (polygon) point {j//2} y={y} out of bounds")
-        else:
-            errors.append(f"Obstacle {i} has invalid format (need 2 coords for circle, 4+ for polygon)")
-
-    return errors
-
-
-def main():
+    sys.stdout.write("\n".join([
+        "=" * 60,
+        "Map Created Successfully!",
+        "=" * 60,
+        f"Map name: {map_name}",
+        f"Target: {target[0]}",
+        f"Obstacles: {len(obstacles)}",
+        f"\nFiles saved to: {map_folder}/",
+        "\nTo use this map in the simulator:",
+        "1. Run: python -m src.main",
+        f"2. Select '{map_name}' from the map dropdown",
+        "=" * 60,
+    ]) + "\n")
+
+
+def main() -> None:
     """Main function."""
     print("Creating map...")
 
@@ -133,7 +90,7 @@ def main():
     map_name, target, obstacles = create_custom_map()
 
     # Validate
-    errors = validate_map(target, obstacles)
+    errors = maps.validate_map(target, obstacles)
     if errors:
         print("\n⚠ Validation Errors:")
         for error in errors:
@@ -16,43 +16,192 @@ import pygame
 import sys
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple, Optional, Union
+from typing import Dict, List, Tuple, Optional, Union
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config import COLOR_CANVAS_BG, COLOR_OBSTACLE, COLOR_TARGET, COLOR_BLACK, COLOR_WHITE
+from src.config import (
+    COLOR_OBSTACLE, COLOR_TARGET, COLOR_BLACK, COLOR_WHITE, OBSTACLE_CIRCLE_RADIUS,
+)
+from src.collision_kernels import first_polygon_containing
+from src.jit import njit
+from src.map_io import (
+    OBSTACLE_CIRCLE,
+    ObstacleSoA,
+    is_map_folder,
+    load_map_data,
+    obstacle_aabbs,
+    pack_obstacles,
+    save_map_archive,
+    unpack_obstacles,
+)
+from tools._pygame_utils import grid_surface, init_window, load_fonts
+
+# Window events after which the display contents may be lost and must be
+# drawn again
+WINDOW_EVENTS = [
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWSIZECHANGED,
+    pygame.VIDEOEXPOSE,
+]
+
+# Event types the editor always reacts to; MOUSEMOTION is only fetched while
+# a drag or polygon needs the pointer position
+EDITOR_EVENTS = [
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP
+] + WINDOW_EVENTS
+
+# Rendered UI strings kept by MapEditor._text
+TEXT_CACHE_SIZE = 64
+
+# Maps listed at once by the map selector overlay
+SELECTOR_ROWS = 12
+
+# Cell size in px of the grid find_obstacle_at looks obstacles up in
+# (the same as the canvas grid)
+PICK_CELL = 50
+
+# Initial vertex capacity of the polygon being drawn (grows when full)
+POLYGON_BUFFER_SIZE = 256
+
+
+@njit(cache=True)
+def compute_bboxes(
+    verts: np.ndarray, offsets: np.ndarray, kind: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pull the polygons out of an obstacle SoA in one pass.
+
+    Returns:
+        (poly_verts, poly_offsets, bboxes): the polygons' vertices and int32
+        offsets in the same layout as the SoA, and their (M, 4) float32
+        [xmin, ymin, xmax, ymax] bounding boxes
+    """
+    n = kind.shape[0]
+    m = 0
+    total = 0
+    for i in range(n):
+        if kind[i] != OBSTACLE_CIRCLE:
+            m += 1
+            total += offsets[i + 1] - offsets[i]
+
+    poly_verts = np.empty((total, 2), dtype=np.float32)
+    poly_offsets = np.zeros(m + 1, dtype=np.int32)
+    bboxes = np.empty((m, 4), dtype=np.float32)
+    p = 0
+    k = 0
+    for i in range(n):
+        if kind[i] == OBSTACLE_CIRCLE:
+            continue
+        xmin = ymin = np.inf
+        xmax = ymax = -np.inf
+        for v in range(offsets[i], offsets[i + 1]):
+            x = verts[v, 0]
+            y = verts[v, 1]
+            poly_verts[k, 0] = x
+            poly_verts[k, 1] = y
+            k += 1
+            xmin = min(xmin, x)
+            xmax = max(xmax, x)
+            ymin = min(ymin, y)
+            ymax = max(ymax, y)
+        bboxes[p, 0] = xmin
+        bboxes[p, 1] = ymin
+        bboxes[p, 2] = xmax
+        bboxes[p, 3] = ymax
+        p += 1
+        poly_offsets[p] = k
+    return poly_verts, poly_offsets, bboxes
+
+
+class ObstacleSprite(pygame.sprite.DirtySprite):
+    """One obstacle's cached image at its place on the canvas."""
+
+    def __init__(
+        self, key: Tuple[Tuple[float, ...], bool], image: pygame.Surface, topleft: Tuple[int, int]
+    ) -> None:
+        super().__init__()
+        self.key = key  # (coordinates, selected) the image was made for
+        self.image = image
+        self.rect = image.get_rect(topleft=topleft)
 
 
 class MapEditor:
     """Interactive map editor."""
 
     def __init__(self):
-        pygame.init()
         self.width = 700
         self.height = 700
         self.ui_height = 120
-        self.screen = pygame.display.set_mode((self.width, self.height + self.ui_height))
-        pygame.display.set_caption("Map Editor - Enhanced")
-
-        self.font_large = pygame.font.Font(None, 32)
-        self.font_medium = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 18)
+        self.screen = init_window(self.width, self.height + self.ui_height, "Map Editor - Enhanced")
+
+        # Keep every other event type out of the queue so it never fills up
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(EDITOR_EVENTS + [pygame.MOUSEMOTION])
+
+        self.font_large, self.font_medium, self.font_small = load_fonts(32, 24, 18)
+        # Rendered text surfaces keyed by (font, text, color), oldest evicted first
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, ...]], pygame.Surface] = {}
+
+        # Everything except the drag/polygon previews is drawn into this
+        # surface, and only redrawn after an event that may change it
+        self._static_surf = pygame.Surface(self.screen.get_size()).convert()
+        self._dirty = True
+        self._exposed = False  # Window contents lost; flip the full screen
+        self._overlay_rects = []  # Screen areas the last frame's previews covered
+
+        # Canvas background and 50px grid, drawn once
+        self._grid_surf = grid_surface(self.width, self.height)
+
+        # Grid plus obstacles. Each obstacle is a sprite in a LayeredDirty
+        # group (layer = list index, selection on top), so a change only
+        # redraws the area of the sprites it adds, removes or replaces
+        self._obstacle_layer = self._grid_surf.copy()
+        self._sprites = pygame.sprite.LayeredDirty()
+        self._sprites.clear(self._obstacle_layer, self._grid_surf)
+        self._obstacle_sprites = {}  # id(obstacle list) -> ObstacleSprite
+
+        # Reused for the semi-transparent circle preview; each frame clears
+        # and blits only the preview's bounding box
+        self._preview_surf = pygame.Surface(
+            (self.width, self.height), pygame.SRCALPHA
+        ).convert_alpha()
+
+        # Circle obstacles all have the same radius, so they are blitted
+        # from two pre-drawn sprites (normal and selected)
+        self._obstacle_sprite = self._circle_sprite(COLOR_OBSTACLE)
+        self._selected_sprite = self._circle_sprite((255, 100, 100))
+        # Polygon sprites keyed by (coordinates, color): (sprite, topleft)
+        self._poly_sprite_cache: Dict[
+            Tuple[Tuple[float, ...], Tuple[int, int, int]], Tuple[pygame.Surface, Tuple[int, int]]
+        ] = {}
 
         # Map data - obstacles can be [x, y] for circles or [x1,y1,x2,y2,...] for polygons
         self.target = [500, 500]
         self.robot_start = [350, 200]  # Default robot start position
         self.obstacles = []
         self.selected_obstacle = None
+        self._rebuild_indices()
+        # Compile the point-in-polygon kernel now rather than on the first click
+        first_polygon_containing(
+            1, 1, np.array([[0, 0], [4, 0], [0, 4]], dtype=np.float32),
+            np.array([0, 3], dtype=np.int32), np.array([0], dtype=np.int64),
+        )
 
         # Circle drawing state
         self.drawing_circle = False
         self.circle_start = None
         self.circle_current_pos = None
 
-        # Polygon drawing state
+        # Polygon drawing state: vertices go into a preallocated buffer, and
+        # polygon_vertices is the tuple list pygame draws from
         self.polygon_mode = False
-        self.polygon_vertices = []
+        self._poly_buf = np.empty((POLYGON_BUFFER_SIZE, 2), dtype=np.int32)
+        self._poly_count = 0
+        self._poly_vertex_list: List[Tuple[int, int]] = []
 
         # Map directory
         self.maps_dir = Path("maps")
@@ -65,6 +214,11 @@ class MapEditor:
         self.editing_name = False
         self.name_input = self.map_name
 
+        # Map selector overlay state (L key)
+        self.selector_active = False
+        self.selector_items = []
+        self.selector_index = 0
+
         self.clock = pygame.time.Clock()
         self._print_instructions()
 
@@ -95,11 +249,33 @@ class MapEditor:
 
     def handle_events(self) -> bool:
         """Handle events. Returns False to quit."""
-        for event in pygame.event.get():
+        # One filtered fetch keeps the events in order; idle mouse motion is
+        # dropped without building Python event objects for it
+        if self.drawing_circle or self.polygon_mode:
+            events = pygame.event.get(EDITOR_EVENTS + [pygame.MOUSEMOTION])
+        else:
+            events = pygame.event.get(EDITOR_EVENTS)
+            pygame.event.clear(pygame.MOUSEMOTION)
+
+        for event in events:
+            # Window events (uncovered, restored) leave the scene as it was
+            # but need the whole screen presented again
+            if event.type in WINDOW_EVENTS:
+                self._exposed = True
+                continue
+
+            # Every other event but mouse motion can change the static scene
+            if event.type != pygame.MOUSEMOTION:
+                self._dirty = True
+
             if event.type == pygame.QUIT:
                 return False
 
             elif event.type == pygame.KEYDOWN:
+                if self.selector_active:
+                    self._handle_selector_key(event.key)
+                    continue
+
                 # Handle text input mode
                 if self.editing_name:
                     if event.key == pygame.K_RETURN:
@@ -127,7 +303,7 @@ class MapEditor:
                     if self.polygon_mode:
                         # Cancel polygon mode
                         self.polygon_mode = False
-                        self.polygon_vertices = []
+                        self._clear_polygon()
                         print("Polygon mode cancelled")
                     else:
                         # Quit editor
@@ -142,20 +318,18 @@ class MapEditor:
                 elif event.key == pygame.K_p:
                     # Enter polygon mode
                     self.polygon_mode = True
-                    self.polygon_vertices = []
+                    self._clear_polygon()
                     self.selected_obstacle = None
                     print("Polygon mode activated - click to add vertices, Enter to finish")
 
                 elif event.key == pygame.K_RETURN:
                     if self.polygon_mode and len(self.polygon_vertices) >= 3:
                         # Complete polygon
-                        polygon_coords = []
-                        for v in self.polygon_vertices:
-                            polygon_coords.extend(v)
-                        self.obstacles.append(polygon_coords)
-                        print(f"Polygon created with {len(self.polygon_vertices)} vertices")
+                        self.obstacles.append(self._poly_buf[:self._poly_count].ravel().tolist())
+                        self._rebuild_indices()
+                        print(f"Polygon created with {self._poly_count} vertices")
                         self.polygon_mode = False
-                        self.polygon_vertices = []
+                        self._clear_polygon()
 
                 elif event.key == pygame.K_s:
                     self.save_map()
@@ -170,8 +344,8 @@ class MapEditor:
                     self.delete_selected()
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                # Don't handle mouse clicks while editing name
-                if self.editing_name:
+                # Don't handle mouse clicks while editing name or choosing a map
+                if self.editing_name or self.selector_active:
                     continue
 
                 x, y = event.pos
@@ -181,7 +355,7 @@ class MapEditor:
                 if event.button == 1:  # Left click
                     if self.polygon_mode:
                         # Add vertex to polygon
-                        self.polygon_vertices.append([x, y])
+                        self._add_vertex(x, y)
                         print(f"Vertex {len(self.polygon_vertices)} added at ({x}, {y})")
                     else:
                         # Check if clicking existing obstacle
@@ -227,6 +401,7 @@ class MapEditor:
                             # Small drag = default circle
                             self.obstacles.append(list(self.circle_start))
                             print(f"Circle obstacle created at {self.circle_start}")
+                        self._rebuild_indices()
 
                     self.drawing_circle = False
                     self.circle_start = None
@@ -234,29 +409,199 @@ class MapEditor:
 
         return True
 
+    @property
+    def polygon_vertices(self) -> List[Tuple[int, int]]:
+        """Vertices of the polygon being drawn."""
+        return self._poly_vertex_list
+
+    def _add_vertex(self, x: int, y: int) -> None:
+        """Append a vertex to the polygon being drawn."""
+        if self._poly_count == len(self._poly_buf):
+            self._poly_buf = np.concatenate((self._poly_buf, np.empty_like(self._poly_buf)))
+        self._poly_buf[self._poly_count] = (x, y)
+        self._poly_count += 1
+        self._poly_vertex_list.append((x, y))
+
+    def _clear_polygon(self) -> None:
+        """Discard the polygon being drawn."""
+        self._poly_count = 0
+        self._poly_vertex_list = []
+
+    def _circle_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """A circle obstacle with its outline, centered in a transparent square."""
+        r = OBSTACLE_CIRCLE_RADIUS
+        sprite = pygame.Surface((2 * r + 2, 2 * r + 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (r + 1, r + 1), r)
+        pygame.draw.circle(sprite, COLOR_BLACK, (r + 1, r + 1), r, 2)
+        return sprite.convert_alpha()
+
+    def _text(
+        self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """font.render(text, True, color), reusing the surface while the text is unchanged."""
+        key = (font, text, tuple(color))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
+    def _rebuild_indices(self, soa: Optional[ObstacleSoA] = None) -> None:
+        """
+        Refresh the hit-test arrays after self.obstacles changes.
+
+        soa may pass the obstacles already in array form (as loaded from a
+        map file) to skip packing self.obstacles again.
+
+        Circle centers, polygon bounding boxes and polygon vertices are kept
+        as flat arrays, with the index of each circle's and polygon's
+        obstacle in self.obstacles.
+        """
+        if soa is None:
+            soa = pack_obstacles(self.obstacles)
+        circles = soa.kind == OBSTACLE_CIRCLE
+        self._circle_ids = np.flatnonzero(circles)
+        self._circle_xy = soa.verts[soa.offsets[:-1][circles]]
+        self._poly_ids = np.flatnonzero(~circles)
+        self._poly_verts, self._poly_offsets, bboxes = compute_bboxes(
+            soa.verts, soa.offsets, soa.kind
+        )
+        # Bounding boxes as pygame Rects for the click prefilter, rounded
+        # outwards so every integer point inside a box is inside its Rect
+        lo = np.floor(bboxes[:, :2]).astype(np.int64)
+        size = np.ceil(bboxes[:, 2:]).astype(np.int64) - lo + 1
+        self._poly_rects = [pygame.Rect(rect) for rect in np.hstack((lo, size)).tolist()]
+        self._build_pick_grid(soa)
+
+        # Drawing data: vertex lists per polygon (None for circles), and
+        # sprites only for polygons that still exist
+        self._poly_points = [
+            None if len(obs) == 2 else [(obs[j], obs[j + 1]) for j in range(0, len(obs), 2)]
+            for obs in self.obstacles
+        ]
+        keys = {tuple(obs) for obs in self.obstacles if len(obs) != 2}
+        self._poly_sprite_cache = {
+            key: entry for key, entry in self._poly_sprite_cache.items() if key[0] in keys
+        }
+
+    def _obstacle_image(self, i: int, is_selected: bool) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Sprite image and screen position for obstacle i."""
+        obs = self.obstacles[i]
+        points = self._poly_points[i]
+        if points is None:
+            offset = OBSTACLE_CIRCLE_RADIUS + 1
+            image = self._selected_sprite if is_selected else self._obstacle_sprite
+            return image, (int(obs[0]) - offset, int(obs[1]) - offset)
+        color = (255, 100, 100) if is_selected else COLOR_OBSTACLE
+        return self._poly_sprite(obs, points, color)
+
+    def _sync_sprites(self) -> None:
+        """Update the obstacle sprite group to match self.obstacles and the selection."""
+        wanted = {id(obs): i for i, obs in enumerate(self.obstacles)}
+        for oid in [oid for oid in self._obstacle_sprites if oid not in wanted]:
+            self._sprites.remove(self._obstacle_sprites.pop(oid))
+
+        top = len(self.obstacles)
+        for oid, i in wanted.items():
+            is_selected = i == self.selected_obstacle
+            key = (tuple(self.obstacles[i]), is_selected)
+            layer = top if is_selected else i
+            sprite = self._obstacle_sprites.get(oid)
+            if sprite is not None and sprite.key == key:
+                # Deleting an earlier obstacle shifts the indices
+                if self._sprites.get_layer_of_sprite(sprite) != layer:
+                    self._sprites.change_layer(sprite, layer)
+                continue
+            if sprite is not None:
+                self._sprites.remove(sprite)
+            sprite = ObstacleSprite(key, *self._obstacle_image(i, is_selected))
+            self._obstacle_sprites[oid] = sprite
+            self._sprites.add(sprite, layer=layer)
+
+    def _poly_sprite(
+        self,
+        obs: List[float],
+        points: List[Tuple[float, float]],
+        color: Tuple[int, int, int],
+    ) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Filled and outlined polygon on a transparent sprite, with its screen position."""
+        key = (tuple(obs), color)
+        entry = self._poly_sprite_cache.get(key)
+        if entry is None:
+            # Pad the vertex bounds for the 2px outline
+            left = int(min(p[0] for p in points)) - 2
+            top = int(min(p[1] for p in points)) - 2
+            right = int(max(p[0] for p in points)) + 3
+            bottom = int(max(p[1] for p in points)) + 3
+            local = [(x - left, y - top) for x, y in points]
+            sprite = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+            pygame.draw.polygon(sprite, color, local)
+            pygame.draw.lines(sprite, COLOR_BLACK, True, local, 2)
+            entry = (sprite.convert_alpha(), (left, top))
+            self._poly_sprite_cache[key] = entry
+        return entry
+
+    def _build_pick_grid(self, soa: ObstacleSoA) -> None:
+        """
+        Bucket obstacles by the PICK_CELL cells their bounding boxes overlap.
+
+        Each cell maps to (circle rows, polygon rows): ascending indices into
+        the circle arrays and the polygon list.
+        """
+        n = len(soa)
+        circles = soa.kind == OBSTACLE_CIRCLE
+        rows = np.empty(n, dtype=np.int64)
+        rows[circles] = np.arange(circles.sum())
+        rows[~circles] = np.arange(n - circles.sum())
+
+        cols = self.width // PICK_CELL
+        lines = self.height // PICK_CELL
+        cells = np.floor(obstacle_aabbs(soa) / PICK_CELL).astype(np.int64)
+        cells[:, 0::2] = cells[:, 0::2].clip(0, cols)
+        cells[:, 1::2] = cells[:, 1::2].clip(0, lines)
+
+        buckets: Dict[Tuple[int, int], Tuple[List[int], List[int]]] = {}
+        for i, (cx0, cy0, cx1, cy1) in enumerate(cells.tolist()):
+            kind = 0 if circles[i] else 1
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    buckets.setdefault((cx, cy), ([], []))[kind].append(int(rows[i]))
+        self._pick_grid = {
+            cell: (np.array(c, dtype=np.int64), np.array(p, dtype=np.int64))
+            for cell, (c, p) in buckets.items()
+        }
+
     def find_obstacle_at(self, x: int, y: int) -> Optional[int]:
-        """Find obstacle at given position."""
-        for i, obs in enumerate(self.obstacles):
-            if len(obs) == 2:  # Circle
-                dist = ((x - obs[0])**2 + (y - obs[1])**2)**0.5
-                if dist <= 45:
-                    return i
-            else:  # Polygon
-                # Simple point-in-polygon check (bounding box for simplicity)
-                points = [(obs[j], obs[j+1]) for j in range(0, len(obs), 2)]
-                min_x = min(p[0] for p in points)
-                max_x = max(p[0] for p in points)
-                min_y = min(p[1] for p in points)
-                max_y = max(p[1] for p in points)
-
-                if min_x <= x <= max_x and min_y <= y <= max_y:
-                    return i
-        return None
+        """Find obstacle at given position (the first one, if several overlap)."""
+        cell = self._pick_grid.get((x // PICK_CELL, y // PICK_CELL))
+        if cell is None:
+            return None
+        circle_rows, poly_rows = cell
+
+        d2 = ((self._circle_xy[circle_rows] - (x, y)) ** 2).sum(axis=1)
+        circle_hits = self._circle_ids[circle_rows[d2 <= OBSTACLE_CIRCLE_RADIUS ** 2]]
+        best = int(circle_hits[0]) if circle_hits.size else len(self.obstacles)
+
+        # Polygons: bounding box prefilter, then a real containment test only
+        # for candidates that come before the first circle hit
+        candidates = np.array(
+            [p for p in poly_rows.tolist() if self._poly_rects[p].collidepoint(x, y)],
+            dtype=np.int64,
+        )
+        candidates = candidates[self._poly_ids[candidates] < best]
+        poly = first_polygon_containing(x, y, self._poly_verts, self._poly_offsets, candidates)
+        if poly >= 0:
+            best = int(self._poly_ids[poly])
+
+        return best if best < len(self.obstacles) else None
 
     def delete_selected(self):
         """Delete currently selected obstacle."""
         if self.selected_obstacle is not None:
             obs = self.obstacles.pop(self.selected_obstacle)
+            self._rebuild_indices()
             obs_type = "circle" if len(obs) == 2 else "polygon"
             print(f"Deleted {obs_type} obstacle")
             self.selected_obstacle = None
@@ -268,16 +613,13 @@ class MapEditor:
 
         maps = []
         for map_folder in self.maps_dir.iterdir():
-            if map_folder.is_dir():
-                target_file = map_folder / "target.npy"
-                obstacles_file = map_folder / "obstacles.npy"
-                if target_file.exists() and obstacles_file.exists():
-                    maps.append(map_folder.name)
+            if map_folder.is_dir() and is_map_folder(map_folder):
+                maps.append(map_folder.name)
 
         return sorted(maps)
 
-    def show_map_selector(self):
-        """Show console-based map selector."""
+    def show_map_selector(self) -> None:
+        """Open the map selector overlay (handled by the event loop)."""
         available_maps = self.get_available_maps()
 
         if not available_maps:
@@ -287,53 +629,36 @@ class MapEditor:
             print("=" * 60)
             return
 
-        print("\n" + "=" * 60)
-        print("Available Maps:")
-        print("=" * 60)
-        for i, map_name in enumerate(available_maps, 1):
-            print(f"  {i}. {map_name}")
-        print()
-        print("Enter map number to load (or 0 to cancel):")
-        print("=" * 60)
-
-        # Simple console input for map selection
-        try:
-            choice = input("Map number: ").strip()
-            if choice.isdigit():
-                choice_num = int(choice)
-                if choice_num == 0:
-                    print("Load cancelled")
-                    return
-                elif 1 <= choice_num <= len(available_maps):
-                    selected_map = available_maps[choice_num - 1]
-                    self.map_name = selected_map
-                    self.load_map()
-                else:
-                    print(f"Invalid choice: {choice_num}")
-            else:
-                print("Invalid input")
-        except (EOFError, KeyboardInterrupt):
-            print("\nLoad cancelled")
-
-    def save_map(self):
+        self.selector_items = available_maps
+        self.selector_index = (
+            available_maps.index(self.map_name) if self.map_name in available_maps else 0
+        )
+        self.selector_active = True
+        print("Choose a map: Up/Down to select, Enter to load, ESC to cancel")
+
+    def _handle_selector_key(self, key: int) -> None:
+        """Move, confirm or cancel the map selector."""
+        if key == pygame.K_UP:
+            self.selector_index = (self.selector_index - 1) % len(self.selector_items)
+        elif key == pygame.K_DOWN:
+            self.selector_index = (self.selector_index + 1) % len(self.selector_items)
+        elif key == pygame.K_RETURN:
+            self.selector_active = False
+            self.map_name = self.selector_items[self.selector_index]
+            self.load_map()
+        elif key == pygame.K_ESCAPE:
+            self.selector_active = False
+            print("Load cancelled")
+
+    def save_map(self) -> None:
         """Save current map to files."""
-        target_data = np.array([self.target])
-        robot_start_data = np.array([self.robot_start])
-        obstacles_data = np.array(self.obstacles, dtype=object)
-
         # Create map folder
         map_folder = self.maps_dir / self.map_name
         map_folder.mkdir(exist_ok=True)
 
-        target_file = map_folder / "target.npy"
-        start_file = map_folder / "start.npy"
-        obstacles_file = map_folder / "obstacles.npy"
+        save_map_archive(map_folder, self.target, pack_obstacles(self.obstacles), self.robot_start)
 
-        np.save(target_file, target_data)
-        np.save(start_file, robot_start_data)
-        np.save(obstacles_file, obstacles_data, allow_pickle=True)
-
-        circles = sum(1 for obs in self.obstacles if len(obs) == 2)
+        circles = len(self._circle_ids)
         polygons = len(self.obstacles) - circles
 
         print("=" * 60)
@@ -343,31 +668,30 @@ class MapEditor:
         print(f"  Total obstacles: {len(self.obstacles)} ({circles} circles, {polygons} polygons)")
         print("=" * 60)
 
-    def load_map(self):
+    def load_map(self) -> None:
         """Load map from files."""
         map_folder = self.maps_dir / self.map_name
-        target_file = map_folder / "target.npy"
-        start_file = map_folder / "start.npy"
-        obstacles_file = map_folder / "obstacles.npy"
 
-        if target_file.exists() and obstacles_file.exists():
-            target_data = np.load(target_file, allow_pickle=True)
-            obstacles_data = np.load(obstacles_file, allow_pickle=True)
+        if is_map_folder(map_folder):
+            data = load_map_data(map_folder)
+            if data is None:
+                print(f"✗ Map '{self.map_name}' has no target or obstacles")
+                return
 
-            self.target = list(target_data[0])
-            self.obstacles = [list(obs) for obs in obstacles_data]
+            self.target = list(data.target[0])
+            self.obstacles = unpack_obstacles(data.obstacles)
+            self._rebuild_indices(data.obstacles)
 
             # Load robot start position if it exists, otherwise use default
-            if start_file.exists():
-                start_data = np.load(start_file, allow_pickle=True)
-                self.robot_start = list(start_data[0])
+            if data.start is not None:
+                self.robot_start = list(data.start[0])
             else:
                 self.robot_start = [350, 200]  # Default
                 print("  Note: No start position found, using default (350, 200)")
 
             self.selected_obstacle = None
 
-            circles = sum(1 for obs in self.obstacles if len(obs) == 2)
+            circles = len(self._circle_ids)
             polygons = len(self.obstacles) - circles
 
             print("=" * 60)
@@ -382,204 +706,259 @@ class MapEditor:
     def clear_map(self):
         """Clear all obstacles."""
         self.obstacles = []
+        self._rebuild_indices()
         self.selected_obstacle = None
-        self.polygon_vertices = []
+        self._clear_polygon()
         self.polygon_mode = False
         print("Map cleared")
 
-    def draw(self):
-        """Draw the editor."""
-        # Clear screen
-        self.screen.fill(COLOR_WHITE)
-
-        # Draw canvas area
-        canvas_rect = pygame.Rect(0, 0, self.width, self.height)
-        pygame.draw.rect(self.screen, COLOR_CANVAS_BG, canvas_rect)
-
-        # Draw grid
-        grid_color = (220, 220, 225)
-        for x in range(0, self.width, 50):
-            pygame.draw.line(self.screen, grid_color, (x, 0), (x, self.height), 1)
-        for y in range(0, self.height, 50):
-            pygame.draw.line(self.screen, grid_color, (0, y), (self.width, y), 1)
-
-        # Draw obstacles
-        for i, obs in enumerate(self.obstacles):
-            is_selected = (i == self.selected_obstacle)
-
-            if len(obs) == 2:  # Circle
-                color = (255, 100, 100) if is_selected else COLOR_OBSTACLE
-                pygame.draw.circle(self.screen, color, (int(obs[0]), int(obs[1])), 45)
-                pygame.draw.circle(self.screen, COLOR_BLACK, (int(obs[0]), int(obs[1])), 45, 2)
-            else:  # Polygon
-                points = [(obs[j], obs[j+1]) for j in range(0, len(obs), 2)]
-                color = (255, 100, 100) if is_selected else COLOR_OBSTACLE
-                pygame.draw.polygon(self.screen, color, points)
-                pygame.draw.polygon(self.screen, COLOR_BLACK, points, 2)
-
-        # Draw circle preview while dragging
-        if self.drawing_circle and self.circle_start and self.circle_current_pos:
-            dx = self.circle_current_pos[0] - self.circle_start[0]
-            dy = self.circle_current_pos[1] - self.circle_start[1]
-            radius = max(10, int((dx**2 + dy**2)**0.5))
-
-            # Draw preview circle with transparency effect
-            preview_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            pygame.draw.circle(
-                preview_surface,
-                (*COLOR_OBSTACLE, 100),  # Semi-transparent
-                self.circle_start,
-                radius,
-            )
-            pygame.draw.circle(
-                preview_surface,
-                COLOR_BLACK,
-                self.circle_start,
-                radius,
-                2
-            )
-            self.screen.blit(preview_surface, (0, 0))
+    def draw(self) -> None:
+        """
+        Draw the editor.
+
+        The static scene is redrawn only when self._dirty is set, and the
+        full screen is flipped after that or after a window event; other
+        frames restore the areas the previous previews covered, draw the
+        previews again and push just those areas to the display, unless
+        nothing moved in polygon mode.
+        """
+        # Polygon mode's only moving part is the guide line to the cursor, so
+        # nothing needs drawing while the mouse is still
+        moved = pygame.mouse.get_rel() != (0, 0)
+        if self.polygon_mode and not moved and not self._dirty and not self._exposed:
+            return
 
-            # Draw line showing radius
-            pygame.draw.line(
-                self.screen,
-                (255, 255, 0),
-                self.circle_start,
-                self.circle_current_pos,
-                2
-            )
+        if self._dirty or self._exposed:
+            if self._dirty:
+                self._draw_static(self._static_surf)
+            self._dirty = False
+            self._exposed = False
+            self.screen.blit(self._static_surf, (0, 0))
+            self._overlay_rects = self._draw_overlays()
+            pygame.display.flip()
+            return
 
-        # Draw polygon in progress
-        if self.polygon_mode and len(self.polygon_vertices) > 0:
-            # Draw vertices
-            for vertex in self.polygon_vertices:
-                pygame.draw.circle(self.screen, (0, 255, 0), vertex, 5)
+        for rect in self._overlay_rects:
+            self.screen.blit(self._static_surf, rect, rect)
+        rects = self._draw_overlays()
+        pygame.display.update(self._overlay_rects + rects)
+        self._overlay_rects = rects
 
-            # Draw edges
-            if len(self.polygon_vertices) > 1:
-                pygame.draw.lines(
-                    self.screen,
-                    (0, 255, 0),
-                    False,
-                    self.polygon_vertices,
-                    2
-                )
+    def _draw_static(self, surf: pygame.Surface) -> None:
+        """Draw the grid, obstacles, robot start, target and UI panel."""
+        # Clear screen
+        surf.fill(COLOR_WHITE)
 
-            # Draw line to mouse position
-            mouse_pos = pygame.mouse.get_pos()
-            if mouse_pos[1] < self.height:
-                pygame.draw.line(
-                    self.screen,
-                    (0, 255, 0, 128),
-                    self.polygon_vertices[-1],
-                    mouse_pos,
-                    1
-                )
-
-            # Draw closing line preview if enough vertices
-            if len(self.polygon_vertices) >= 3:
-                pygame.draw.line(
-                    self.screen,
-                    (255, 255, 0),
-                    self.polygon_vertices[-1],
-                    self.polygon_vertices[0],
-                    1
-                )
+        # Draw canvas area, grid and obstacles
+        self._sync_sprites()
+        self._sprites.draw(self._obstacle_layer)
+        surf.blit(self._obstacle_layer, (0, 0))
 
         # Draw robot start position
         pygame.draw.circle(
-            self.screen, (59, 130, 246), (int(self.robot_start[0]), int(self.robot_start[1])), 12
+            surf, (59, 130, 246), (int(self.robot_start[0]), int(self.robot_start[1])), 12
         )
         pygame.draw.circle(
-            self.screen, COLOR_BLACK, (int(self.robot_start[0]), int(self.robot_start[1])), 12, 2
+            surf, COLOR_BLACK, (int(self.robot_start[0]), int(self.robot_start[1])), 12, 2
         )
         pygame.draw.circle(
-            self.screen, COLOR_WHITE, (int(self.robot_start[0]), int(self.robot_start[1])), 3
+            surf, COLOR_WHITE, (int(self.robot_start[0]), int(self.robot_start[1])), 3
         )
 
         # Draw target
         pygame.draw.circle(
-            self.screen, COLOR_TARGET, (int(self.target[0]), int(self.target[1])), 25
+            surf, COLOR_TARGET, (int(self.target[0]), int(self.target[1])), 25
         )
         pygame.draw.circle(
-            self.screen, (255, 255, 0), (int(self.target[0]), int(self.target[1])), 15
+            surf, (255, 255, 0), (int(self.target[0]), int(self.target[1])), 15
         )
         pygame.draw.circle(
-            self.screen, COLOR_WHITE, (int(self.target[0]), int(self.target[1])), 4
+            surf, COLOR_WHITE, (int(self.target[0]), int(self.target[1])), 4
         )
 
         # Draw UI panel
         ui_rect = pygame.Rect(0, self.height, self.width, self.ui_height)
-        pygame.draw.rect(self.screen, (40, 40, 45), ui_rect)
+        pygame.draw.rect(surf, (40, 40, 45), ui_rect)
 
         # Draw title and mode indicator
         mode_text = "POLYGON MODE" if self.polygon_mode else "CIRCLE MODE"
         mode_color = (100, 255, 100) if self.polygon_mode else (100, 200, 255)
 
-        title = self.font_large.render("Map Editor", True, COLOR_WHITE)
-        self.screen.blit(title, (20, self.height + 10))
+        title = self._text(self.font_large, "Map Editor", COLOR_WHITE)
+        surf.blit(title, (20, self.height + 10))
 
-        mode = self.font_medium.render(mode_text, True, mode_color)
-        self.screen.blit(mode, (200, self.height + 15))
+        mode = self._text(self.font_medium, mode_text, mode_color)
+        surf.blit(mode, (200, self.height + 15))
 
         # Draw stats
-        circles = sum(1 for obs in self.obstacles if len(obs) == 2)
+        circles = len(self._circle_ids)
         polygons = len(self.obstacles) - circles
 
-        stats = self.font_small.render(
+        stats = self._text(
+            self.font_small,
             f"Obstacles: {len(self.obstacles)} ({circles} circles, {polygons} polygons) | Target: ({self.target[0]}, {self.target[1]})",
-            True,
             (200, 200, 200),
         )
-        self.screen.blit(stats, (20, self.height + 50))
+        surf.blit(stats, (20, self.height + 50))
 
         # Draw polygon progress
         if self.polygon_mode:
-            poly_progress = self.font_small.render(
+            poly_progress = self._text(
+                self.font_small,
                 f"Polygon vertices: {len(self.polygon_vertices)} (need 3+ to complete, press Enter)",
-                True,
                 (150, 255, 150),
             )
-            self.screen.blit(poly_progress, (20, self.height + 70))
+            surf.blit(poly_progress, (20, self.height + 70))
         else:
             # Draw controls
-            controls = self.font_small.render(
+            controls = self._text(
+                self.font_small,
                 "Drag: Circle | P: Polygon | RClick: Target | Del: Remove | N: Name | S: Save | L: Load",
-                True,
                 (150, 150, 150),
             )
-            self.screen.blit(controls, (20, self.height + 70))
+            surf.blit(controls, (20, self.height + 70))
 
         # Draw map name input
         if self.editing_name:
             # Show text input box
             name_bg = pygame.Rect(20, self.height + 90, 400, 25)
-            pygame.draw.rect(self.screen, (60, 60, 65), name_bg)
-            pygame.draw.rect(self.screen, (100, 200, 255), name_bg, 2)
+            pygame.draw.rect(surf, (60, 60, 65), name_bg)
+            pygame.draw.rect(surf, (100, 200, 255), name_bg, 2)
 
-            name_text = self.font_small.render(
+            name_text = self._text(
+                self.font_small,
                 f"Map name: {self.name_input}_",
-                True,
                 (255, 255, 255),
             )
-            self.screen.blit(name_text, (25, self.height + 95))
+            surf.blit(name_text, (25, self.height + 95))
 
-            hint_text = self.font_small.render(
+            hint_text = self._text(
+                self.font_small,
                 "(Press Enter to confirm, ESC to cancel)",
-                True,
                 (150, 150, 150),
             )
-            self.screen.blit(hint_text, (430, self.height + 95))
+            surf.blit(hint_text, (430, self.height + 95))
         else:
             # Show current map name
-            hint = self.font_small.render(
+            hint = self._text(
+                self.font_small,
                 f"Map name: {self.map_name} (press N to edit, S to save)",
-                True,
                 (120, 120, 120),
             )
-            self.screen.blit(hint, (20, self.height + 95))
+            surf.blit(hint, (20, self.height + 95))
+
+        if self.selector_active:
+            self._draw_selector(surf)
+
+    def _draw_selector(self, surf: pygame.Surface) -> None:
+        """Draw the map selector as a panel over the canvas."""
+        rows = SELECTOR_ROWS
+        # Scroll so the selected map stays visible
+        first = min(
+            max(0, self.selector_index - rows // 2), max(0, len(self.selector_items) - rows)
+        )
+        items = self.selector_items[first:first + rows]
+
+        panel = pygame.Rect(0, 0, 360, 70 + 26 * len(items))
+        panel.center = (self.width // 2, self.height // 2)
+        pygame.draw.rect(surf, (40, 40, 45), panel)
+        pygame.draw.rect(surf, (100, 200, 255), panel, 2)
+
+        surf.blit(
+            self._text(self.font_medium, "Load Map", COLOR_WHITE), (panel.x + 15, panel.y + 12)
+        )
+        for row, name in enumerate(items, first):
+            y = panel.y + 42 + 26 * (row - first)
+            if row == self.selector_index:
+                pygame.draw.rect(surf, (70, 90, 120), (panel.x + 8, y - 3, panel.width - 16, 24))
+            surf.blit(
+                self._text(self.font_small, f"{row + 1}. {name}", COLOR_WHITE),
+                (panel.x + 20, y + 2),
+            )
+        surf.blit(
+            self._text(
+                self.font_small, "Up/Down: Select | Enter: Load | ESC: Cancel", (150, 150, 150)
+            ),
+            (panel.x + 15, panel.bottom - 22),
+        )
+
+    def _draw_overlays(self) -> List[pygame.Rect]:
+        """Draw the circle and polygon previews; returns the areas they cover."""
+        rects = []
+
+        # Draw circle preview while dragging
+        if self.drawing_circle and self.circle_start and self.circle_current_pos:
+            dx = self.circle_current_pos[0] - self.circle_start[0]
+            dy = self.circle_current_pos[1] - self.circle_start[1]
+            radius = max(10, int((dx**2 + dy**2)**0.5))
+
+            # Draw preview circle with transparency effect
+            cx, cy = self.circle_start
+            area = pygame.Rect(cx - radius - 2, cy - radius - 2, 2 * (radius + 2), 2 * (radius + 2))
+            area = area.clip(self._preview_surf.get_rect())
+            self._preview_surf.fill((0, 0, 0, 0), area)
+            pygame.draw.circle(
+                self._preview_surf,
+                (*COLOR_OBSTACLE, 100),  # Semi-transparent
+                self.circle_start,
+                radius,
+            )
+            pygame.draw.circle(
+                self._preview_surf,
+                COLOR_BLACK,
+                self.circle_start,
+                radius,
+                2
+            )
+            rects.append(self.screen.blit(self._preview_surf, area.topleft, area))
+
+            # Draw line showing radius
+            rects.append(pygame.draw.line(
+                self.screen,
+                (255, 255, 0),
+                self.circle_start,
+                self.circle_current_pos,
+                2
+            ))
+
+        # Draw polygon in progress
+        if self.polygon_mode and len(self.polygon_vertices) > 0:
+            # Draw vertices
+            for vertex in self.polygon_vertices:
+                rects.append(pygame.draw.circle(self.screen, (0, 255, 0), vertex, 5))
+
+            # Draw edges
+            if len(self.polygon_vertices) > 1:
+                rects.append(pygame.draw.lines(
+                    self.screen,
+                    (0, 255, 0),
+                    False,
+                    self.polygon_vertices,
+                    2
+                ))
+
+            # Draw line to mouse position
+            mouse_pos = pygame.mouse.get_pos()
+            if mouse_pos[1] < self.height:
+                rects.append(pygame.draw.line(
+                    self.screen,
+                    (0, 255, 0, 128),
+                    self.polygon_vertices[-1],
+                    mouse_pos,
+                    1
+                ))
+
+            # Draw closing line preview if enough vertices
+            if len(self.polygon_vertices) >= 3:
+                rects.append(pygame.draw.line(
+                    self.screen,
+                    (255, 255, 0),
+                    self.polygon_vertices[-1],
+                    self.polygon_vertices[0],
+                    1
+                ))
 
-        pygame.display.flip()
+        return rects
 
     def run(self):
         """Main loop."""
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Build map folders from the declarative specs in tools/map_specs/.
+
+Each spec is a JSON file named after its map:
+
+    name         map folder name under maps/
+    start        [x, y] robot start (optional)
+    target       [x, y] target position
+    obstacles    flat obstacle lists: [x, y] circles, [x1, y1, x2, y2, ...] polygons
+    rects        [x1, y1, x2, y2] axis-aligned rectangles, added as polygons
+    difficulty, description, purpose, features
+                 optional text for the summary and the map's README.md
+
+Usage:
+    python -m tools.maps list
+    python -m tools.maps build --name dense_forest
+    python -m tools.maps build --all --jobs 4
+"""
+
+import argparse
+import functools
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.map_io import (
+    AABB_FILE,
+    AABB_ORDER_FILE,
+    MAP_ARCHIVE,
+    pack_obstacles,
+    save_array,
+    save_map_archive,
+)
+from src.jit import njit
+from tools._map_utils import (
+    GOAL_DISTANCE_FILE,
+    GRID_FILES,
+    JPSPLUS_FILE,
+    NAVGRAPH_FILE,
+    spec_hash,
+    needs_rebuild,
+    mark_built,
+    rasterize,
+    save_grid,
+    rects_to_polys,
+    dedupe_obstacles,
+    build_navgraph,
+    save_navgraph,
+    compute_jpsplus,
+    save_jpsplus,
+    goal_distance,
+)
+
+SPECS_DIR = Path(__file__).parent / "map_specs"
+MAPS_DIR = Path("maps")
+
+# Files save_map writes into every map folder
+MAP_FILES = (
+    (MAP_ARCHIVE, AABB_FILE, AABB_ORDER_FILE)
+    + GRID_FILES
+    + (NAVGRAPH_FILE, JPSPLUS_FILE, GOAL_DISTANCE_FILE)
+)
+
+
+def list_specs() -> List[str]:
+    """Names of all map specs, without reading them."""
+    return sorted(path.stem for path in SPECS_DIR.glob("*.json"))
+
+
+def _freeze(value: Any) -> Any:
+    """Turn the lists of a parsed spec into tuples, recursively."""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def load_spec(name: str) -> Mapping[str, Any]:
+    """
+    Read the spec for one map.
+
+    Specs are parsed once per process and returned read-only (lists become
+    tuples), so the cached copy cannot be changed by a caller.
+    """
+    path = SPECS_DIR / f"{name}.json"
+    if not path.exists():
+        raise FileNotFoundError(f"No map spec named '{name}' in {SPECS_DIR}")
+    with open(path) as f:
+        spec: Mapping[str, Any] = _freeze(json.load(f))
+    return spec
+
+
+def spec_rects(spec: Mapping[str, Any]) -> np.ndarray:
+    """Rectangles of a spec as one (N, 4) int16 array of [x1, y1, x2, y2]."""
+    return np.asarray(spec.get("rects", []), dtype=np.int16).reshape(-1, 4)
+
+
+def spec_obstacles(spec: Mapping[str, Any]) -> List[Sequence[float]]:
+    """All obstacles of a spec as flat sequences, rectangles converted to polygons."""
+    obstacles: List[Sequence[float]] = [list(obs) for obs in spec.get("obstacles", [])]
+    # Rows of the (N, 8) float32 polygon array, no per-coordinate lists
+    obstacles.extend(rects_to_polys(spec_rects(spec)))
+    return obstacles
+
+
+def spec_readme(spec: Mapping[str, Any], num_obstacles: int) -> Optional[str]:
+    """README.md contents for a spec with a description, else None."""
+    if "description" not in spec:
+        return None
+    return f"""# {spec['name'].replace('_', ' ').title()} Map
+
+**Difficulty:** {spec.get('difficulty', '?')} ⭐
+**Description:** {spec['description']}
+
+## Layout
+- Start: {list(spec['start']) if 'start' in spec else None}
+- Target: {list(spec['target'])}
+- Obstacles: {num_obstacles}
+
+## Training Purpose
+{spec.get('purpose', 'General navigation training')}
+"""
+
+
+# Obstacle format flags reported by _validate_coords
+_BAD_FORMAT = 1  # Neither a circle (2 coords) nor a polygon (4+ coords)
+_ODD_COORDS = 2  # Polygon with an odd number of coordinates
+
+
+@njit(cache=True)
+def _validate_coords(
+    coords: np.ndarray, offsets: np.ndarray, lo: float, hi: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Check every obstacle's coordinates in one pass.
+
+    Args:
+        coords: (C,) float64 coordinates of all obstacles, concatenated
+        offsets: (N + 1,) int64 obstacle i owns coords[offsets[i]:offsets[i + 1]]
+
+    Returns:
+        (flags, out_of_bounds): (N,) uint8 bitmask of _BAD_FORMAT/_ODD_COORDS,
+        and a (C,) bool mask of checked coordinates outside [lo, hi]
+    """
+    n = offsets.shape[0] - 1
+    flags = np.zeros(n, dtype=np.uint8)
+    out_of_bounds = np.zeros(coords.shape[0], dtype=np.bool_)
+    for i in range(n):
+        start = offsets[i]
+        count = offsets[i + 1] - start
+        if count != 2 and count < 4:
+            flags[i] = _BAD_FORMAT
+            continue
+        if count % 2 == 1:
+            flags[i] = _ODD_COORDS
+            count -= 1
+        for k in range(start, start + count):
+            c = coords[k]
+            out_of_bounds[k] = not (c >= lo and c <= hi)
+    return flags, out_of_bounds
+
+
+def validate_map(
+    target: Sequence[Sequence[float]], obstacles: Sequence[Sequence[float]]
+) -> List[str]:
+    """Validate the map data."""
+    errors = []
+
+    # Check target
+    if not target or len(target) == 0:
+        errors.append("No target defined")
+    elif len(target[0]) != 2:
+        errors.append("Target must be [x, y]")
+    else:
+        x, y = target[0]
+        if not (0 <= x <= 700):
+            errors.append(f"Target x={x} out of bounds (0-700)")
+        if not (0 <= y <= 700):
+            errors.append(f"Target y={y} out of bounds (0-700)")
+
+    # Check obstacles: flatten to homogeneous arrays for the kernel, then
+    # format its findings
+    lengths = [len(obs) for obs in obstacles]
+    offsets = np.zeros(len(obstacles) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    coords = np.fromiter(
+        (c for obs in obstacles for c in obs), dtype=np.float64, count=int(offsets[-1])
+    )
+    flags, out_of_bounds = _validate_coords(coords, offsets, 0.0, 700.0)
+
+    found = []  # (obstacle index, coordinate index, message)
+    for i in np.flatnonzero(flags).tolist():
+        if flags[i] == _BAD_FORMAT:
+            found.append(
+                (
+                    i,
+                    -1,
+                    f"Obstacle {i} has invalid format (need 2 coords for circle, 4+ for polygon)",
+                )
+            )
+        else:
+            found.append((i, -1, f"Obstacle {i} (polygon) has odd number of coordinates"))
+
+    bad = np.flatnonzero(out_of_bounds)
+    owners = np.searchsorted(offsets, bad, side="right") - 1
+    for k, i in zip(bad.tolist(), owners.tolist()):
+        j = k - int(offsets[i])
+        obs = obstacles[i]
+        axis = "xy"[j % 2]
+        if len(obs) == 2:
+            msg = f"Obstacle {i} (circle) {axis}={obs[j]} out of bounds"
+        else:
+            msg = f"Obstacle {i} (polygon) point {j // 2} {axis}={obs[j]} out of bounds"
+        found.append((i, j, msg))
+
+    found.sort(key=lambda entry: entry[:2])
+    errors.extend(msg for _, _, msg in found)
+
+    return errors
+
+
+def save_map(
+    name: str,
+    start: Optional[Sequence[float]],
+    target: Sequence[float],
+    obstacles: Sequence[Sequence[float]],
+    readme: Optional[str] = None,
+    maps_dir: Path = MAPS_DIR,
+) -> bool:
+    """
+    Write a map folder: map.npz (start, target, obstacles), collision grid,
+    JPS+ table, goal distance field, visibility graph and README.
+
+    Args:
+        start: [x, y] robot start, or None to let the simulator pick one
+        target: [x, y] target position
+        obstacles: flat obstacle lists (see src/map_io.py)
+        readme: optional README.md contents
+
+    Returns:
+        False if the folder was already built from this exact map, else True
+    """
+    map_folder = Path(maps_dir) / name
+    map_folder.mkdir(parents=True, exist_ok=True)
+
+    # A copy-pasted obstacle would otherwise be collision-checked twice
+    obstacles, removed = dedupe_obstacles(obstacles)
+    if removed:
+        print(f"⚠ {name}: dropped {removed} duplicate obstacle(s)")
+
+    # Skip the writes if the map was already built from this exact spec and
+    # none of its files have been removed since
+    digest = spec_hash(start, target, obstacles, readme)
+    outputs: Tuple[str, ...] = MAP_FILES
+    if readme is not None:
+        outputs += ("README.md",)
+    if not needs_rebuild(map_folder, digest, outputs):
+        return False
+
+    soa = pack_obstacles(obstacles)
+    save_map_archive(map_folder, target, soa, start)
+    grid = rasterize(soa)
+    save_grid(map_folder, grid)
+    save_jpsplus(map_folder, compute_jpsplus(grid, target))
+    save_array(map_folder / GOAL_DISTANCE_FILE, goal_distance(grid, target))
+    save_navgraph(map_folder, build_navgraph(soa))
+    if readme is not None:
+        (map_folder / "README.md").write_text(readme)
+    mark_built(map_folder, digest)
+    return True
+
+
+def build(name: str, maps_dir: Path = MAPS_DIR) -> Tuple[bool, List[str]]:
+    """
+    Build one map from its spec.
+
+    Returns:
+        (ok, report) - ok is False if the spec was invalid; report holds the
+        summary lines, so maps built in parallel print in order
+    """
+    spec = load_spec(name)
+    obstacles = spec_obstacles(spec)
+
+    errors = validate_map([spec["target"]], obstacles)
+    if errors:
+        return False, [f"⚠ {name}: validation errors"] + [f"  - {error}" for error in errors]
+
+    written = save_map(
+        spec["name"],
+        spec.get("start"),
+        spec["target"],
+        obstacles,
+        readme=spec_readme(spec, len(obstacles)),
+        maps_dir=maps_dir,
+    )
+    if not written:
+        return True, [f"✓ {name} is up to date (cached)"]
+
+    difficulty = f" ({spec['difficulty']})" if "difficulty" in spec else ""
+    report = [f"✓ Created {name}{difficulty} - {len(obstacles)} obstacles"]
+    if spec.get("start") is not None:
+        report.append(f"  Start: {tuple(spec['start'])}")
+    report.append(f"  Target: {tuple(spec['target'])}")
+    report.extend(f"  - {feature}" for feature in spec.get("features", []))
+    return True, report
+
+
+def build_all(names: Sequence[str], maps_dir: Path = MAPS_DIR, jobs: int = 1) -> bool:
+    """
+    Build several maps, printing each summary in order.
+
+    Maps are independent and building them is mostly file I/O (np.save
+    releases the GIL while writing), so jobs > 1 builds them on a thread pool.
+    """
+    if jobs > 1 and len(names) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(lambda name: build(name, maps_dir), names))
+    else:
+        results = [build(name, maps_dir) for name in names]
+
+    # One write for every summary instead of a print per line
+    sys.stdout.write("".join(line + "\n" for _, report in results for line in report))
+    return all(ok for ok, _ in results)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Build maps from tools/map_specs/")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List available map specs")
+    build_parser = sub.add_parser("build", help="Build map folders from specs")
+    build_parser.add_argument(
+        "--name", action="append", default=[], help="Map to build (repeatable)"
+    )
+    build_parser.add_argument("--all", action="store_true", help="Build every spec")
+    build_parser.add_argument(
+        "--maps-dir", type=Path, default=MAPS_DIR, help="Output directory (default: maps)"
+    )
+    build_parser.add_argument(
+        "--jobs", type=int, default=1, help="Maps to build in parallel (default: 1)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name in list_specs():
+            print(name)
+        return 0
+
+    names = list_specs() if args.all else args.name
+    if not names:
+        build_parser.error("give --name NAME or --all")
+
+    return 0 if build_all(names, args.maps_dir, args.jobs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,13 +11,14 @@ This will preview maps/my_map_target.npy and maps/my_map_obstacles.npy
 
 import pygame
 import sys
-import numpy as np
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.config import COLOR_CANVAS_BG, COLOR_OBSTACLE, COLOR_TARGET, COLOR_BLACK, COLOR_WHITE
+from src.config import COLOR_OBSTACLE, COLOR_TARGET, COLOR_BLACK, COLOR_WHITE
+from src.map_io import is_map_folder, load_map_data, unpack_obstacles
+from tools._pygame_utils import grid_surface, init_window, load_fonts
 
 
 def preview_map(map_name: str):
@@ -25,26 +26,24 @@ def preview_map(map_name: str):
     # Load map files from folder structure
     maps_dir = Path("maps")
     map_folder = maps_dir / map_name
-    target_file = map_folder / "target.npy"
-    start_file = map_folder / "start.npy"
-    obstacles_file = map_folder / "obstacles.npy"
 
-    if not target_file.exists() or not obstacles_file.exists():
+    if not is_map_folder(map_folder):
         print(f"Error: Map '{map_name}' not found")
         print(f"Looking for: {map_folder}/")
         return
 
-    # Load data
-    target_data = np.load(target_file, allow_pickle=True)
-    obstacles_data = np.load(obstacles_file, allow_pickle=True)
-
-    target = target_data[0]
-    obstacles = list(obstacles_data)
+    # Load data; .npy files are memory-mapped, since only the first row of
+    # the target and start arrays is read
+    data = load_map_data(map_folder, mmap_mode="r")
+    if data is None:
+        print(f"Error: Map '{map_name}' has no target or obstacles")
+        return
+    target = data.target[0]
+    obstacles = unpack_obstacles(data.obstacles)
 
     # Load robot start position
-    if start_file.exists():
-        start_data = np.load(start_file, allow_pickle=True)
-        robot_start = start_data[0]
+    if data.start is not None:
+        robot_start = data.start[0]
     else:
         robot_start = [350, 200]  # Default
 
@@ -67,14 +66,15 @@ def preview_map(map_name: str):
     print("=" * 60)
 
     # Initialize pygame
-    pygame.init()
     width, height = 700, 700
-    screen = pygame.display.set_mode((width, height + 50))
-    pygame.display.set_caption(f"Map Preview: {map_name}")
+    screen = init_window(width, height + 50, f"Map Preview: {map_name}")
 
-    font = pygame.font.Font(None, 24)
+    font = load_fonts(24)[0]
     clock = pygame.time.Clock()
 
+    # Canvas background and grid, drawn once
+    grid_surf = grid_surface(width, height)
+
     # Main loop
     running = True
     while running:
@@ -88,16 +88,8 @@ def preview_map(map_name: str):
         # Draw
         screen.fill(COLOR_WHITE)
 
-        # Canvas background
-        canvas_rect = pygame.Rect(0, 0, width, height)
-        pygame.draw.rect(screen, COLOR_CANVAS_BG, canvas_rect)
-
-        # Grid
-        grid_color = (220, 220, 225)
-        for x in range(0, width, 50):
-            pygame.draw.line(screen, grid_color, (x, 0), (x, height), 1)
-        for y in range(0, height, 50):
-            pygame.draw.line(screen, grid_color, (0, y), (width, y), 1)
+        # Canvas background and grid
+        screen.blit(grid_surf, (0, 0))
 
         # Obstacles
         for obs in obstacles:
@@ -148,11 +140,8 @@ def main():
         if maps_dir.exists():
             maps = []
             for map_folder in maps_dir.iterdir():
-                if map_folder.is_dir():
-                    target_file = map_folder / "target.npy"
-                    obstacles_file = map_folder / "obstacles.npy"
-                    if target_file.exists() and obstacles_file.exists():
-                        maps.append(map_folder.name)
+                if map_folder.is_dir() and is_map_folder(map_folder):
+                    maps.append(map_folder.name)
 
             if maps:
                 for map_name in sorted(maps):
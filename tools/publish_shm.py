@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Share a map's obstacle arrays between processes through shared memory.
+
+RL training runs many environment workers that all load the same map. The
+publisher copies the obstacle arrays (verts, offsets, kind) into named
+multiprocessing.shared_memory segments once and writes a small shm.json
+sidecar into the map folder; workers then attach to those segments instead of
+reading the files, so every worker shares one physical copy.
+
+Usage:
+    python tools/publish_shm.py dense_forest open_field
+
+Segments stay published until the publisher is stopped (Ctrl+C), which
+unlinks them and removes the sidecars. In a worker:
+
+    from tools.publish_shm import attach_obstacles
+    soa, handles = attach_obstacles("maps/dense_forest")
+    ...
+    del soa  # views must be released before closing
+    for shm in handles:
+        shm.close()
+"""
+
+import json
+import sys
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import List, Tuple
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.map_io import ObstacleSoA, load_obstacles
+
+SHM_SIDECAR = "shm.json"
+
+
+def _untrack(shm: SharedMemory) -> None:
+    """
+    Stop this process's resource tracker from unlinking an attached segment
+    when the process exits; only the publisher owns the segment.
+    """
+    try:
+        # _name is the tracker's key (name with its leading "/" on POSIX)
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    except (AttributeError, KeyError):
+        pass
+
+
+def publish_obstacles(map_folder: Path) -> List[SharedMemory]:
+    """
+    Copy a map's obstacle arrays into shared memory and write its sidecar.
+
+    Returns:
+        The created segments; the caller must keep them and pass them to
+        unpublish when done
+    """
+    map_folder = Path(map_folder)
+    soa = load_obstacles(map_folder)
+    if soa is None:
+        raise FileNotFoundError(f"No obstacles in {map_folder}/")
+
+    segments = []
+    sidecar = {}
+    try:
+        for key, arr in soa._asdict().items():
+            arr = np.ascontiguousarray(arr)
+            name = f"map_{map_folder.name}_{key}"
+            try:
+                # Zero-sized segments are not allowed
+                shm = SharedMemory(name=name, create=True, size=max(arr.nbytes, 1))
+            except FileExistsError:
+                raise FileExistsError(
+                    f"Segment {name} exists, probably left by a publisher that was "
+                    f"killed; unlink /dev/shm/{name} and retry"
+                ) from None
+            segments.append(shm)
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+            sidecar[key] = {"name": shm.name, "dtype": arr.dtype.str, "shape": list(arr.shape)}
+    except BaseException:
+        # Not returned to the caller yet, so nothing else would unlink them
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+        raise
+
+    (map_folder / SHM_SIDECAR).write_text(json.dumps(sidecar))
+    return segments
+
+
+def unpublish(map_folder: Path, segments: List[SharedMemory]) -> None:
+    """Remove a map's sidecar and unlink its segments."""
+    sidecar = Path(map_folder) / SHM_SIDECAR
+    if sidecar.exists():
+        sidecar.unlink()
+    for shm in segments:
+        shm.close()
+        shm.unlink()
+
+
+def attach_obstacles(map_folder: Path) -> Tuple[ObstacleSoA, List[SharedMemory]]:
+    """
+    Attach to a published map's obstacle arrays.
+
+    Returns:
+        (obstacles, handles) - the arrays are views into the shared segments;
+        drop them before closing the handles
+    """
+    sidecar = json.loads((Path(map_folder) / SHM_SIDECAR).read_text())
+    arrays = []
+    handles = []
+    for key in ObstacleSoA._fields:
+        info = sidecar[key]
+        shm = SharedMemory(name=info["name"])
+        _untrack(shm)
+        handles.append(shm)
+        arrays.append(
+            np.ndarray(tuple(info["shape"]), dtype=np.dtype(info["dtype"]), buffer=shm.buf)
+        )
+    return ObstacleSoA(*arrays), handles
+
+
+def main() -> None:
+    """Publish the named maps until interrupted."""
+    names = sys.argv[1:]
+    if not names:
+        print("Usage: python tools/publish_shm.py <map_name> [<map_name> ...]")
+        return
+
+    published = []
+    try:
+        for name in names:
+            map_folder = Path("maps") / name
+            published.append((map_folder, publish_obstacles(map_folder)))
+            print(f"✓ Published {name} ({map_folder / SHM_SIDECAR})")
+        print("Press Ctrl+C to unpublish")
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    except FileExistsError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        for map_folder, segments in published:
+            unpublish(map_folder, segments)
+        if published:
+            print(f"\n✓ Unpublished {len(published)} map(s)")
+
+
+if __name__ == "__main__":
+    main()
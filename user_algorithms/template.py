@@ -1,16 +1,92 @@
 """Template for creating custom navigation algorithms.
 
-Copy this file and modify it to create your own algorithm!
+Copy this file and modify it to create your own algorithm! QUICK_START.md
+shows how to register it with the simulator.
 """
 
 import math
-from typing import Optional
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Optional, Tuple
+import numpy as np
 
 from src.algorithms.base import NavigationAlgorithm
 from src.environment import Environment
+from src.jit import NUMBA_AVAILABLE, cfunc, njit
+
+
+# tan(22.5 degrees): the slope halfway between two 45-degree directions
+_TAN_22_5 = math.sqrt(2.0) - 1.0
+
+# Snapped angle for index band * 4 + (dy < 0) * 2 + (dx < 0), where band is
+# 0 near the x axis, 1 near a diagonal and 2 near the y axis
+_OCTANT = (
+    0, 180, 0, 180,
+    45, 135, 315, 225,
+    90, 90, 270, 270,
+)
+_OCTANT_ARRAY = np.array(_OCTANT, dtype=np.float64)
+
+# (cos, sin) of each snapped angle, same indexing
+_OCTANT_VECTORS = tuple(
+    (math.cos(math.radians(angle)), math.sin(math.radians(angle))) for angle in _OCTANT
+)
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _octant_index(dx: float, dy: float) -> int:
+    """Index of (dx, dy)'s nearest 45-degree direction in _OCTANT."""
+    ax = abs(dx)
+    ay = abs(dy)
+    band = int(ay > _TAN_22_5 * ax) + int(ax < _TAN_22_5 * ay)
+    return band * 4 + (dy < 0) * 2 + (dx < 0)
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def _compute_snapped_angle(dx: float, dy: float) -> float:
+    """
+    Angle of (dx, dy) in degrees, snapped to the nearest multiple of 45.
+
+    Same result as rounding math.degrees(math.atan2(dy, dx)) to 45 degrees,
+    but the 8 possible answers are picked with comparisons instead of
+    atan2. Keeping the per-step math in a plain function of numbers lets
+    Numba compile it (see src/jit.py), releasing the GIL so robots stepped
+    on separate threads do not wait on each other; without Numba it runs
+    as ordinary Python.
+    """
+    return _OCTANT[_octant_index(dx, dy)]
+
+
+# Compile once at import instead of on the first simulation step
+_compute_snapped_angle(1.0, 1.0)
+
+
+@cfunc("float64(float64, float64, float64, float64)", cache=True)
+def _direction_cfunc(robot_x: float, robot_y: float, target_x: float, target_y: float) -> float:
+    """Snapped direction from robot to target, callable from C."""
+    return float(_compute_snapped_angle(target_x - robot_x, target_y - robot_y))
+
+
+# C function pointer, typed double (*)(double, double, double, double), for
+# simulator loops written in C or Cython; None without Numba
+DIRECTION_CFUNC_ADDRESS = _direction_cfunc.address if NUMBA_AVAILABLE else None
+
+
+def _octant_indices(dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+    """
+    _octant_index for arrays of offsets.
+
+    Returns:
+        uint8 indices into _OCTANT, built with comparisons and in-place
+        integer arithmetic only
+    """
+    ax = np.abs(dx)
+    ay = np.abs(dy)
+    # Views of freshly made bool masks, so no copies
+    index: np.ndarray = (ay > _TAN_22_5 * ax).view(np.uint8)
+    index += ax < _TAN_22_5 * ay
+    index <<= 2
+    index += (dy < 0).view(np.uint8) << 1
+    index += dx < 0
+    return index
 
 
 class TemplateAlgorithm(NavigationAlgorithm):
@@ -20,9 +96,23 @@ class TemplateAlgorithm(NavigationAlgorithm):
     TODO: Describe what your algorithm does here.
     """
 
-    def __init__(self):
+    # Fixed attribute slots instead of a per-instance __dict__. Name every
+    # attribute you set on self here, e.g. ("_tx", "_ty", "visited_positions"),
+    # or delete this line to allow any attribute.
+    __slots__ = ("_tx", "_ty", "_last_x", "_last_y", "_last_angle")
+
+    def __init__(self) -> None:
         """Initialize your algorithm with any parameters needed."""
         super().__init__()
+        # Target position, read from the environment on the first step
+        # after a reset (the target does not move during a run)
+        self._tx: Optional[float] = None
+        self._ty: Optional[float] = None
+        # Position and answer of the previous step; a robot blocked by an
+        # obstacle asks again from the same spot
+        self._last_x: Optional[float] = None
+        self._last_y: Optional[float] = None
+        self._last_angle = 0.0
         # Add your initialization code here
         # Example:
         # self.some_parameter = 1.0
@@ -61,84 +151,94 @@ class TemplateAlgorithm(NavigationAlgorithm):
         """
         # TODO: Implement your navigation algorithm here!
 
-        # Example 1: Simple target seeking
-        dx = environment.target.x - robot_x
-        dy = environment.target.y - robot_y
-        angle = math.degrees(math.atan2(dy, dx))
-
-        # Normalize to 0-360
-        if angle < 0:
-            angle += 360
-
-        # Snap to nearest 45-degree angle
-        angle = round(angle / 45) * 45
-
-        return angle % 360
-
-        # Example 2: Using sonar for obstacle avoidance
-        # if sonar is not None:
-        #     # Get safe directions from sonar
-        #     sonar.sweep(robot_x, robot_y, environment,
-        #                target_centric=False, robot_radius=robot_radius)
-        #
-        #     if sonar.allowed_directions:
-        #         # Pick the direction closest to target
-        #         target_angle = math.degrees(math.atan2(
-        #             environment.target.y - robot_y,
-        #             environment.target.x - robot_x
-        #         ))
-        #         if target_angle < 0:
-        #             target_angle += 360
-        #
-        #         best_angle = min(sonar.allowed_directions,
-        #                        key=lambda a: abs(a - target_angle))
-        #         return best_angle
-        #
-        # # Fallback: continue current heading
-        # return robot_heading
-
-    def reset(self) -> None:
+        # Example: simple target seeking. ALGORITHM_GUIDE.md has more,
+        # including sonar-based obstacle avoidance
+        if robot_x == self._last_x and robot_y == self._last_y:
+            return self._last_angle
+        tx = self._tx
+        ty = self._ty
+        if tx is None or ty is None:
+            target = environment.target
+            tx = target.x
+            ty = target.y
+            self._tx = tx
+            self._ty = ty
+        self._last_x = robot_x
+        self._last_y = robot_y
+        angle: float = _compute_snapped_angle(tx - robot_x, ty - robot_y)
+        self._last_angle = angle
+        return angle
+
+    def compute_direction_batch(
+        self,
+        robot_xs: np.ndarray,
+        robot_ys: np.ndarray,
+        robot_radius: float,
+        robot_headings: np.ndarray,
+        environment: Environment,
+        sonar: Optional[object] = None,
+    ) -> np.ndarray:
         """
-        Reset algorithm state when simulation restarts.
+        Compute directions for many robots with one set of array operations.
 
-        Override this if your algorithm maintains internal state.
+        Gives the same angles as calling compute_direction for each robot.
+        If you change compute_direction, update this too or delete it to
+        fall back to the per-robot loop of the base class.
         """
-        # Example:
-        # self.visited_positions = []
-        # self.stuck_count = 0
-        pass
+        dx = environment.target.x - np.asarray(robot_xs, dtype=np.float64)
+        dy = environment.target.y - np.asarray(robot_ys, dtype=np.float64)
+        angles: np.ndarray = _OCTANT_ARRAY[_octant_indices(dx, dy)]
+        return angles
 
-    def on_collision(self) -> None:
+    def compute_direction_vec(
+        self,
+        robot_x: float,
+        robot_y: float,
+        robot_radius: float,
+        robot_heading: float,
+        environment: Environment,
+        sonar: Optional[object] = None,
+    ) -> Tuple[float, float]:
         """
-        Called when the robot collides with an obstacle.
+        Direction of compute_direction as a unit vector.
 
-        Override this if you want to react to collisions.
+        Returns:
+            (cos, sin) of the snapped angle, looked up from a table, so code
+            moving the robot needs no trigonometry
         """
-        # Example:
-        # self.collision_count += 1
-        # print(f"Collision detected! Total: {self.collision_count}")
-        pass
+        tx = self._tx
+        ty = self._ty
+        if tx is None or ty is None:
+            target = environment.target
+            tx = target.x
+            ty = target.y
+            self._tx = tx
+            self._ty = ty
+        return _OCTANT_VECTORS[_octant_index(tx - robot_x, ty - robot_y)]
 
-    def on_target_reached(self) -> None:
+    def reset(self) -> None:
         """
-        Called when the robot reaches the target.
+        Reset algorithm state when simulation restarts.
 
-        Override this if you want to react to reaching the target.
+        Override this if your algorithm maintains internal state.
         """
+        # The map, and with it the target, may have changed
+        self._tx = None
+        self._ty = None
+        self._last_x = None
+        self._last_y = None
         # Example:
-        # print(f"Target reached in {self.steps} steps!")
-        pass
-
-
-# To use this algorithm:
-# 1. Copy this file to a new filename (e.g., my_algorithm.py)
-# 2. Rename the class (e.g., MyCustomAlgorithm)
-# 3. Implement the compute_direction() method
-# 4. Add it to src/main.py:
-#
-#    from user_algorithms.my_algorithm import MyCustomAlgorithm
-#
-#    self.algorithms = [
-#        # ... existing algorithms ...
-#        MyCustomAlgorithm(),
-#    ]
+        # self.visited_positions = []
+        # self.stuck_count = 0
+
+    # The simulator only calls the hooks a subclass defines, so these are
+    # left out until needed. To react to events, uncomment and fill in:
+    #
+    # def on_collision(self) -> None:
+    #     """Called when the robot collides with an obstacle."""
+    #     self.collision_count += 1
+    #     print(f"Collision detected! Total: {self.collision_count}")
+    #
+    # def on_target_reached(self) -> None:
+    #     """Called when the robot reaches the target."""
+    #     print(f"Target reached in {self.steps} steps!")